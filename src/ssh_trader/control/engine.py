@@ -8,6 +8,9 @@ from typing import Literal
 from ssh_trader.live.venue import FillReport, OrderRequest, VenueAdapter
 from ssh_trader.risk.governor import RiskGovernor
 
+# C-level fabs; avoids the builtin abs() dispatch in the per-bar hot path.
+_fabs = math.fabs
+
 
 @dataclass(frozen=True, slots=True)
 class ControlConfig:
@@ -59,6 +62,30 @@ class ControlEngine:
         self._peak_equity = 0.0
         self._pending_qty = 0.0
         self._order_num = 0
+        # mev_mode is frozen, so the route hint never changes after init.
+        self._route_hint_s = self._route_hint()
+        # Skip decisions are immutable and identical except for the reason, so
+        # one instance per reason is built up front and reused on every skip.
+        # The regime tag on a skipped bar is cosmetic (nothing trades), so the
+        # cached instances carry an empty regime_state.
+        self._skip_decisions: dict[str, ControlDecision] = {
+            reason: ControlDecision(
+                intended_order=None,
+                hypothetical_fill=None,
+                slippage_estimate_bps=0.0,
+                regime_state="",
+                skipped=True,
+                reason=reason,
+                route_hint=self._route_hint_s,
+            )
+            for reason in (
+                "rebalance_wait",
+                "invalid_price",
+                "oracle_divergence",
+                "vol_spike_active",
+                "below_min_qty",
+            )
+        }
 
     def _next_id(self) -> str:
         self._order_num += 1
@@ -72,7 +99,7 @@ class ControlEngine:
     def _estimate_slippage_bps(self, qty: float, mark: float, equity: float) -> float:
         if equity <= 0.0:
             return 0.0
-        notional_frac = abs(qty * mark) / equity
+        notional_frac = _fabs(qty * mark) / equity
         return notional_frac * self._cfg.max_slippage_bps
 
     def on_bar(
@@ -85,47 +112,30 @@ class ControlEngine:
         vol_pct: float | None,
         vol_spike_active: bool,
     ) -> ControlDecision:
-        mark = self._venue.get_mark_price(self._cfg.symbol)
-        margin = self._venue.get_margin_status()
+        # Hoist attribute chains to locals; on_bar runs once per bar and
+        # LOAD_FAST beats LOAD_ATTR on every reuse below.
+        cfg = self._cfg
+        venue = self._venue
+        sym = cfg.symbol
+
+        # Skip-check first: a waiting bar must not cost venue round-trips.
+        self._bar_idx += 1
+        if (self._bar_idx - 1) % cfg.rebalance_interval_bars != 0:
+            return self._skip_decisions["rebalance_wait"]
+
+        mark = venue.get_mark_price(sym)
+        margin = venue.get_margin_status()
         if self._peak_equity <= 0.0:
             self._peak_equity = margin.equity
         if margin.equity > self._peak_equity:
             self._peak_equity = margin.equity
 
-        self._bar_idx += 1
-        if (self._bar_idx - 1) % self._cfg.rebalance_interval_bars != 0:
-            return ControlDecision(
-                intended_order=None,
-                hypothetical_fill=None,
-                slippage_estimate_bps=0.0,
-                regime_state=regime_state,
-                skipped=True,
-                reason="rebalance_wait",
-                route_hint=self._route_hint(),
-            )
-
         if oracle_price <= 0.0 or mark <= 0.0:
-            return ControlDecision(
-                intended_order=None,
-                hypothetical_fill=None,
-                slippage_estimate_bps=0.0,
-                regime_state=regime_state,
-                skipped=True,
-                reason="invalid_price",
-                route_hint=self._route_hint(),
-            )
+            return self._skip_decisions["invalid_price"]
 
-        div_bps = abs(mark - oracle_price) / oracle_price * 1e4
-        if div_bps > self._cfg.oracle_divergence_bps:
-            return ControlDecision(
-                intended_order=None,
-                hypothetical_fill=None,
-                slippage_estimate_bps=0.0,
-                regime_state=regime_state,
-                skipped=True,
-                reason="oracle_divergence",
-                route_hint=self._route_hint(),
-            )
+        div_bps = _fabs(mark - oracle_price) * (1e4 / oracle_price)
+        if div_bps > cfg.oracle_divergence_bps:
+            return self._skip_decisions["oracle_divergence"]
 
         decision = self._risk.decide(
             nav=margin.equity,
@@ -134,15 +144,7 @@ class ControlEngine:
             requested_directional=target.directional_requested,
         )
         if vol_spike_active:
-            return ControlDecision(
-                intended_order=None,
-                hypothetical_fill=None,
-                slippage_estimate_bps=0.0,
-                regime_state=regime_state,
-                skipped=True,
-                reason="vol_spike_active",
-                route_hint=self._route_hint(),
-            )
+            return self._skip_decisions["vol_spike_active"]
         if decision.mode == "flat":
             target_qty = 0.0
         elif decision.mode == "carry_only" and target.directional_requested:
@@ -150,28 +152,16 @@ class ControlEngine:
         else:
             target_qty = target.target_perp_qty
 
-        positions = self._venue.get_positions()
-        cur_qty = 0.0
-        for pos in positions:
-            signed = pos.quantity if pos.side == "long" else -pos.quantity
-            if pos.symbol == self._cfg.symbol:
-                cur_qty += signed
+        cur_qty = venue.get_signed_position(sym)
 
         qty_delta = (target_qty - cur_qty) + self._pending_qty
-        if abs(qty_delta) <= self._cfg.min_order_qty:
+        abs_delta = _fabs(qty_delta)
+        if abs_delta <= cfg.min_order_qty:
             self._pending_qty = 0.0
-            return ControlDecision(
-                intended_order=None,
-                hypothetical_fill=None,
-                slippage_estimate_bps=0.0,
-                regime_state=regime_state,
-                skipped=True,
-                reason="below_min_qty",
-                route_hint=self._route_hint(),
-            )
+            return self._skip_decisions["below_min_qty"]
 
         slippage_est = self._estimate_slippage_bps(qty_delta, mark, margin.equity)
-        if slippage_est > self._cfg.max_slippage_bps:
+        if slippage_est > cfg.max_slippage_bps:
             return ControlDecision(
                 intended_order=None,
                 hypothetical_fill=None,
@@ -179,18 +169,18 @@ class ControlEngine:
                 regime_state=regime_state,
                 skipped=True,
                 reason="slippage_guard",
-                route_hint=self._route_hint(),
+                route_hint=self._route_hint_s,
             )
 
         side: Literal["buy", "sell"] = "buy" if qty_delta > 0 else "sell"
         order = OrderRequest(
             client_order_id=self._next_id(),
-            symbol=self._cfg.symbol,
+            symbol=sym,
             side=side,
-            quantity=abs(qty_delta),
+            quantity=abs_delta,
             reduce_only=False,
         )
-        fill = self._venue.place_order(order)
+        fill = venue.place_order(order)
         self._pending_qty = 0.0
         if fill.status == "partial":
             remaining = fill.requested_qty - fill.filled_qty
@@ -203,5 +193,5 @@ class ControlEngine:
             regime_state=regime_state,
             skipped=False,
             reason=None,
-            route_hint=self._route_hint(),
+            route_hint=self._route_hint_s,
         )
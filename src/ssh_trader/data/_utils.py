@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def assert_strictly_increasing(ts_int: np.ndarray) -> None:
+    """Raise unless the int64 timestamp array is strictly increasing.
+
+    One vectorized diff pass; shared by the clean/gap/resample helpers so
+    they agree on the error message.
+    """
+    if ts_int.shape[0] > 1 and not bool((np.diff(ts_int) > 0).all()):
+        raise ValueError("timestamps must be strictly increasing")
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 
-from .model import OHLCVFrame, to_utc_aware
+import numpy as np
+
+from ._utils import assert_strictly_increasing
+from .model import OHLCVFrame, epoch_us_to_utc, to_utc_aware
 
 
 @dataclass(frozen=True, slots=True)
@@ -19,37 +23,34 @@ def normalize_and_sort(frame: OHLCVFrame) -> tuple[OHLCVFrame, CleanStats]:
     if n == 0:
         return frame, CleanStats(deduped=0, sorted=True, filled=0)
 
-    entries = list(range(n))
     ts_utc = [to_utc_aware(t) for t in frame.ts]
+    # Frame timestamps are already validated UTC, so the cached numeric column
+    # matches ts_utc element for element.
+    ts_us = frame.ts_ns // 1000
+
+    was_sorted = bool((np.diff(ts_us) >= 0).all()) if n > 1 else True
+    order = np.argsort(ts_us, kind="stable")
+    ts_sorted = ts_us[order]
+
+    # De-duplicate timestamps, keeping the last occurrence: the first hit of
+    # each value in the reversed sorted array is its last occurrence.
+    _, first_in_rev = np.unique(ts_sorted[::-1], return_index=True)
+    keep = order[(n - 1) - first_in_rev]
+    deduped = n - len(keep)
 
-    was_sorted = all(ts_utc[i] <= ts_utc[i + 1] for i in range(n - 1))
-    entries.sort(key=lambda i: ts_utc[i])
-
-    # De-duplicate timestamps: keep the last occurrence.
-    deduped = 0
-    keep: list[int] = []
-    last_ts: datetime | None = None
-    for idx in entries:
-        t = ts_utc[idx]
-        if last_ts is not None and t == last_ts:
-            deduped += 1
-            keep[-1] = idx
-        else:
-            keep.append(idx)
-            last_ts = t
-
-    def take(series: list[float] | None) -> list[float] | None:
+    def take(series: np.ndarray | Sequence[float] | None) -> np.ndarray | None:
         if series is None:
             return None
-        return [series[i] for i in keep]
+        # Free view: __post_init__ already coerced the column to an ndarray.
+        return np.asarray(series)[keep]
 
     out = OHLCVFrame(
-        ts=[ts_utc[i].astimezone(timezone.utc) for i in keep],
-        open=[frame.open[i] for i in keep],
-        high=[frame.high[i] for i in keep],
-        low=[frame.low[i] for i in keep],
-        close=[frame.close[i] for i in keep],
-        volume=[frame.volume[i] for i in keep],
+        ts=[ts_utc[i] for i in keep.tolist()],
+        open=np.asarray(frame.open)[keep],
+        high=np.asarray(frame.high)[keep],
+        low=np.asarray(frame.low)[keep],
+        close=np.asarray(frame.close)[keep],
+        volume=np.asarray(frame.volume)[keep],
         funding=take(frame.funding),
         open_interest=take(frame.open_interest),
     )
@@ -70,59 +71,56 @@ def fill_missing_intervals(
     """
     if timeframe_seconds <= 0:
         raise ValueError("timeframe_seconds must be positive")
-    if len(frame) == 0:
+    n = len(frame)
+    if n == 0:
         return frame, CleanStats(deduped=0, sorted=True, filled=0)
 
-    dt = timedelta(seconds=timeframe_seconds)
-    ts: list[datetime] = [frame.ts[0]]
-    o: list[float] = [frame.open[0]]
-    h: list[float] = [frame.high[0]]
-    low: list[float] = [frame.low[0]]
-    c: list[float] = [frame.close[0]]
-    v: list[float] = [frame.volume[0]]
-
-    funding: list[float] | None = [frame.funding[0]] if frame.funding is not None else None
-    oi: list[float] | None = [frame.open_interest[0]] if frame.open_interest is not None else None
-
-    filled = 0
-    for i in range(1, len(frame)):
-        prev_t = ts[-1]
-        expected = prev_t + dt
-        current = frame.ts[i]
-        while expected < current:
-            prev_close = c[-1]
-            ts.append(expected)
-            o.append(prev_close)
-            h.append(prev_close)
-            low.append(prev_close)
-            c.append(prev_close)
-            v.append(0.0)
-            if funding is not None:
-                funding.append(0.0)
-            if oi is not None:
-                oi.append(0.0)
-            filled += 1
-            expected = expected + dt
-
-        ts.append(current)
-        o.append(frame.open[i])
-        h.append(frame.high[i])
-        low.append(frame.low[i])
-        c.append(frame.close[i])
-        v.append(frame.volume[i])
-        if funding is not None and frame.funding is not None:
-            funding.append(frame.funding[i])
-        if oi is not None and frame.open_interest is not None:
-            oi.append(frame.open_interest[i])
+    dt_us = timeframe_seconds * 1_000_000
+    ts_us = frame.ts_ns // 1000
+    assert_strictly_increasing(ts_us)
+
+    # Synthetic bars per gap (ceil(delta / dt) - 1), then each source row's
+    # slot in the expanded output; everything else is fancy indexing off a
+    # carry-forward source index, no per-gap Python insertions.
+    k = np.maximum((np.diff(ts_us) + dt_us - 1) // dt_us - 1, 0)
+    total = int(n + k.sum())
+    if total == n:
+        return frame, CleanStats(deduped=0, sorted=True, filled=0)
+
+    # Free views: __post_init__ already coerced the columns to float64 arrays.
+    open_ = np.asarray(frame.open)
+    high = np.asarray(frame.high)
+    low = np.asarray(frame.low)
+    close = np.asarray(frame.close)
+    volume = np.asarray(frame.volume)
+
+    pos = np.concatenate(([0], np.cumsum(k + 1)))
+    real = np.zeros(total, dtype=bool)
+    real[pos] = True
+    # Index of the most recent real row at or before each output slot.
+    src = np.cumsum(real) - 1
+
+    # Synthetic timestamps step dt from the previous real bar.
+    ts_out_us = ts_us[src] + (np.arange(total) - pos[src]) * dt_us
+    carry = close[src]
+    ts: list[datetime] = epoch_us_to_utc(ts_out_us)
 
     out = OHLCVFrame(
         ts=ts,
-        open=o,
-        high=h,
-        low=low,
-        close=c,
-        volume=v,
-        funding=funding,
-        open_interest=oi,
+        open=np.where(real, open_[src], carry),
+        high=np.where(real, high[src], carry),
+        low=np.where(real, low[src], carry),
+        close=carry,
+        volume=np.where(real, volume[src], 0.0),
+        funding=(
+            np.where(real, np.asarray(frame.funding)[src], 0.0)
+            if frame.funding is not None
+            else None
+        ),
+        open_interest=(
+            np.where(real, np.asarray(frame.open_interest)[src], 0.0)
+            if frame.open_interest is not None
+            else None
+        ),
     )
-    return out, CleanStats(deduped=0, sorted=True, filled=filled)
+    return out, CleanStats(deduped=0, sorted=True, filled=total - n)
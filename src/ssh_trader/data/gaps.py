@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
+import numpy as np
+
+from ._utils import assert_strictly_increasing
 from .model import to_utc_aware
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_US = timedelta(microseconds=1)
+
 
 def count_missing_intervals(ts: Sequence[datetime], timeframe_seconds: int) -> int:
     """Count missing intervals in a timestamp series.
@@ -21,15 +27,12 @@ def count_missing_intervals(ts: Sequence[datetime], timeframe_seconds: int) -> i
     if len(ts) < 2:
         return 0
 
-    ts_utc = [to_utc_aware(t) for t in ts]
-    missing = 0
-    for a, b in zip(ts_utc[:-1], ts_utc[1:], strict=True):
-        delta = (b - a).total_seconds()
-        if delta <= 0:
-            raise ValueError("timestamps must be strictly increasing")
-        steps = int(round(delta / timeframe_seconds))
-        if abs(delta - (steps * timeframe_seconds)) > 1.0:
-            raise ValueError("timestamps are not aligned to timeframe_seconds")
-        if steps > 1:
-            missing += steps - 1
-    return missing
+    ts_us = np.fromiter(
+        ((to_utc_aware(t) - _EPOCH) // _US for t in ts), dtype=np.int64, count=len(ts)
+    )
+    assert_strictly_increasing(ts_us)
+    deltas = np.diff(ts_us) / 1e6
+    steps = np.rint(deltas / timeframe_seconds).astype(np.int64)
+    if (np.abs(deltas - steps * timeframe_seconds) > 1.0).any():
+        raise ValueError("timestamps are not aligned to timeframe_seconds")
+    return int(np.maximum(steps - 1, 0).sum())
@@ -2,11 +2,27 @@ from __future__ import annotations
 
 import json
 import math
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 from typing import Any
-from urllib import request
+from urllib.parse import urlsplit
+
+import numpy as np
+
+_json_loads: Callable[[bytes | bytearray | str], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on the environment
+    # json.loads accepts bytes directly, so the fallback still skips the
+    # intermediate str decode.
+    _json_loads = json.loads
 
 _INTERVAL_MS: dict[str, int] = {
     "1m": 60_000,
@@ -27,6 +43,7 @@ _INTERVAL_MS: dict[str, int] = {
 
 _MAX_CANDLES_PER_REQ = 5000
 _MAX_FUNDING_EVENTS_PER_REQ = 5000
+_MAX_CONCURRENT_PAGES = 8
 
 
 @dataclass(frozen=True, slots=True)
@@ -49,17 +66,48 @@ def parse_time_ms(value: str) -> int:
     return int(dt.timestamp() * 1000)
 
 
+# Keep-alive connections, one per worker thread: paging the same host pays the
+# TCP/TLS handshake once per thread instead of once per request.
+_conn_local = threading.local()
+
+
+def _connect(scheme: str, netloc: str, timeout_s: float) -> HTTPConnection:
+    if scheme == "https":
+        return HTTPSConnection(netloc, timeout=timeout_s)
+    return HTTPConnection(netloc, timeout=timeout_s)
+
+
+def _get_connection(scheme: str, netloc: str, timeout_s: float) -> HTTPConnection:
+    key = (scheme, netloc, timeout_s)
+    cached = getattr(_conn_local, "conn", None)
+    if cached is not None:
+        if cached[0] == key:
+            return cached[1]  # type: ignore[no-any-return]
+        cached[1].close()
+    conn = _connect(scheme, netloc, timeout_s)
+    _conn_local.conn = (key, conn)
+    return conn
+
+
 def _http_post_json(base_url: str, payload: dict[str, Any], timeout_s: float) -> Any:
     body = json.dumps(payload).encode("utf-8")
-    req = request.Request(
-        f"{base_url.rstrip('/')}/info",
-        data=body,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-    with request.urlopen(req, timeout=timeout_s) as resp:
-        raw = resp.read().decode("utf-8")
-    return json.loads(raw)
+    parts = urlsplit(base_url.rstrip("/"))
+    path = f"{parts.path}/info"
+    headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+    conn = _get_connection(parts.scheme, parts.netloc, timeout_s)
+    try:
+        conn.request("POST", path, body=body, headers=headers)
+        raw = conn.getresponse().read()
+    except (HTTPException, OSError):
+        # The pooled connection may have gone stale (server-side idle close);
+        # reconnect once before giving up.
+        conn.close()
+        conn = _connect(parts.scheme, parts.netloc, timeout_s)
+        _conn_local.conn = ((parts.scheme, parts.netloc, timeout_s), conn)
+        conn.request("POST", path, body=body, headers=headers)
+        raw = conn.getresponse().read()
+    return _json_loads(raw)
 
 
 def _as_float(raw: Any, *, default: float = 0.0) -> float:
@@ -87,6 +135,18 @@ def _as_int(raw: Any, *, default: int = 0) -> int:
     return default
 
 
+def _parse_candle_fast(item: dict[str, Any]) -> tuple[int, float, float, float, float, float]:
+    """Parse a candle assuming Hyperliquid's fixed key schema (no alternative-key probing)."""
+    return (
+        int(item["t"]),
+        float(item["o"]),
+        float(item["h"]),
+        float(item["l"]),
+        float(item["c"]),
+        float(item["v"]),
+    )
+
+
 def _parse_candle(item: dict[str, Any]) -> tuple[int, float, float, float, float, float]:
     ts_ms = _as_int(item.get("t"))
     if ts_ms == 0:
@@ -117,7 +177,7 @@ def fetch_candles(
 ) -> list[tuple[int, float, float, float, float, float]]:
     if interval not in _INTERVAL_MS:
         raise ValueError(f"unsupported interval: {interval}")
-    out: list[tuple[int, float, float, float, float, float]] = []
+    pages: list[np.ndarray] = []
 
     step_ms = _INTERVAL_MS[interval]
 
@@ -133,15 +193,22 @@ def fetch_candles(
 
     cursor = max(start_ms, earliest_ms)
 
-    while cursor < end_ms:
-        chunk_end = min(end_ms, cursor + step_ms * _MAX_CANDLES_PER_REQ)
+    # Candle pages cover fixed, disjoint time windows, so they are all known
+    # up front and can be fetched concurrently instead of one RTT at a time.
+    span_ms = step_ms * _MAX_CANDLES_PER_REQ
+    windows = [(s, min(end_ms, s + span_ms)) for s in range(cursor, end_ms, span_ms)]
+
+    def fetch_window(
+        window: tuple[int, int],
+    ) -> list[tuple[int, float, float, float, float, float]]:
+        win_start, win_end = window
         payload = {
             "type": "candleSnapshot",
             "req": {
                 "coin": coin,
                 "interval": interval,
-                "startTime": cursor,
-                "endTime": chunk_end,
+                "startTime": win_start,
+                "endTime": win_end,
             },
         }
         data = _http_post_json(base_url, payload, timeout_s)
@@ -150,30 +217,35 @@ def fetch_candles(
             raise ValueError(f"candleSnapshot error: {data}")
         if not isinstance(data, list):
             raise ValueError(f"unexpected candleSnapshot response type: {type(data)}")
-        chunk: list[tuple[int, float, float, float, float, float]] = []
-        for row in data:
-            if isinstance(row, dict):
-                chunk.append(_parse_candle(row))
-        if not chunk:
-            # No candles in this window: advance by one chunk.
-            cursor = chunk_end
-            continue
+        try:
+            chunk = [_parse_candle_fast(row) for row in data if isinstance(row, dict)]
+        except (KeyError, TypeError, ValueError):
+            # Unexpected schema; fall back to the alternative-key probing parser.
+            chunk = [_parse_candle(row) for row in data if isinstance(row, dict)]
         chunk.sort(key=lambda x: x[0])
-        out.extend(chunk)
-        last_ts = chunk[-1][0]
-        nxt = last_ts + step_ms
-        if nxt <= cursor:
-            break
-        cursor = nxt
-        # API docs mention 5000-candle availability. stop if we already reached end.
-        if last_ts >= end_ms - step_ms:
-            break
-    # Deduplicate timestamps.
-    dedup: dict[int, tuple[int, float, float, float, float, float]] = {}
-    for row in out:
-        dedup[row[0]] = row
-    rows = [dedup[k] for k in sorted(dedup.keys()) if start_ms <= k <= end_ms]
-    return rows
+        return chunk
+
+    if len(windows) <= 1:
+        chunks = [fetch_window(w) for w in windows]
+    else:
+        with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_PAGES, len(windows))) as pool:
+            chunks = list(pool.map(fetch_window, windows))
+    pages.extend(np.asarray(chunk, dtype=np.float64) for chunk in chunks if chunk)
+    if not pages:
+        return []
+
+    # Deduplicate timestamps (keep the latest page's row), sort, clamp to window.
+    # ms timestamps are exactly representable in float64 (< 2^53).
+    merged = np.concatenate(pages)
+    # The fast-path parser skips per-value isfinite checks; validate in bulk.
+    if not np.isfinite(merged).all():
+        raise ValueError("candleSnapshot returned non-finite values")
+    ts = merged[:, 0].astype(np.int64)
+    _, first_in_rev = np.unique(ts[::-1], return_index=True)
+    keep = (len(ts) - 1) - first_in_rev
+    kept_ts = ts[keep]
+    kept = merged[keep][(kept_ts >= start_ms) & (kept_ts <= end_ms)]
+    return [(int(row[0]), row[1], row[2], row[3], row[4], row[5]) for row in kept.tolist()]
 
 
 def fetch_funding_history(
@@ -184,7 +256,12 @@ def fetch_funding_history(
     end_ms: int,
     timeout_s: float = 15.0,
 ) -> list[tuple[int, float]]:
-    out: list[tuple[int, float]] = []
+    # Dedup on insert: funding pages arrive in timestamp order, so insertion
+    # order doubles as sort order and the final sorted() pass is only needed
+    # if a page ever comes back out of order.
+    dedup: dict[int, float] = {}
+    last_ts = 0
+    needs_sort = False
     cursor = start_ms
     while cursor <= end_ms:
         # Funding is typically 8h; request in chunks to avoid server-side limits.
@@ -204,7 +281,7 @@ def fetch_funding_history(
             cursor = chunk_end + 1
             continue
 
-        chunk: list[tuple[int, float]] = []
+        n_events = 0
         for row in data:
             if not isinstance(row, dict):
                 continue
@@ -212,27 +289,29 @@ def fetch_funding_history(
             if ts == 0:
                 continue
             rate = _as_float(row.get("fundingRate", row.get("funding", row.get("rate"))))
-            chunk.append((ts, rate))
-        if not chunk:
+            if ts < last_ts and ts not in dedup:
+                needs_sort = True
+            dedup[ts] = rate
+            if ts > last_ts:
+                last_ts = ts
+            n_events += 1
+        if n_events == 0:
             cursor = chunk_end + 1
             continue
-        chunk.sort(key=lambda x: x[0])
-        out.extend(chunk)
-        last_ts = chunk[-1][0]
+
         nxt = last_ts + 1
         if nxt <= cursor:
             break
         cursor = nxt
-        if len(chunk) >= _MAX_FUNDING_EVENTS_PER_REQ:
+        if n_events >= _MAX_FUNDING_EVENTS_PER_REQ:
             # Likely hit a server-side limit; continue from the last ts.
             continue
         if last_ts >= end_ms:
             break
 
-    dedup: dict[int, float] = {}
-    for ts, rate in out:
-        dedup[ts] = rate
-    return [(k, dedup[k]) for k in sorted(dedup.keys())]
+    if needs_sort:
+        return sorted(dedup.items())
+    return list(dedup.items())
 
 
 def fetch_latest_open_interest(
@@ -266,33 +345,45 @@ def fetch_latest_open_interest(
     return _as_float(row.get("openInterest"), default=0.0)
 
 
+def _merge_asof(
+    candle_ts: np.ndarray, funding_ts: np.ndarray, funding_rate: np.ndarray
+) -> np.ndarray:
+    """As-of join: last funding rate at or before each candle timestamp (0.0 before any)."""
+    idx = np.searchsorted(funding_ts, candle_ts, side="right") - 1
+    out = funding_rate[np.maximum(idx, 0)] if funding_rate.size else np.zeros(candle_ts.shape[0])
+    return np.where(idx >= 0, out, 0.0)
+
+
 def merge_history_rows(
     *,
     candles: list[tuple[int, float, float, float, float, float]],
     funding: list[tuple[int, float]],
     default_open_interest: float = 0.0,
 ) -> list[HistoryRow]:
-    funding_sorted = sorted(funding, key=lambda x: x[0])
-    fi = 0
-    cur_funding = 0.0
-    rows: list[HistoryRow] = []
-    for ts, o, h, low_value, c, v in sorted(candles, key=lambda x: x[0]):
-        while fi < len(funding_sorted) and funding_sorted[fi][0] <= ts:
-            cur_funding = funding_sorted[fi][1]
-            fi += 1
-        rows.append(
-            HistoryRow(
-                ts_ms=ts,
-                open=o,
-                high=h,
-                low=low_value,
-                close=c,
-                volume=v,
-                funding=cur_funding,
-                open_interest=default_open_interest,
-            )
+    if not candles:
+        return []
+
+    candles_sorted = sorted(candles, key=lambda x: x[0])
+
+    candle_ts = np.fromiter((row[0] for row in candles_sorted), dtype=np.int64, count=len(candles))
+    funding_ts = np.fromiter((ts for ts, _ in funding), dtype=np.int64, count=len(funding))
+    funding_rate = np.fromiter((rate for _, rate in funding), dtype=np.float64, count=len(funding))
+    order = np.argsort(funding_ts, kind="stable")
+    funding_col = _merge_asof(candle_ts, funding_ts[order], funding_rate[order])
+
+    return [
+        HistoryRow(
+            ts_ms=ts,
+            open=o,
+            high=h,
+            low=low_value,
+            close=c,
+            volume=v,
+            funding=float(funding_col[i]),
+            open_interest=default_open_interest,
         )
-    return rows
+        for i, (ts, o, h, low_value, c, v) in enumerate(candles_sorted)
+    ]
 
 
 def ts_ms_to_utc_iso(ts_ms: int) -> str:
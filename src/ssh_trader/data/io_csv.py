@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 import csv
-from datetime import datetime, timezone
+import re
+from collections.abc import Collection
+from datetime import datetime
 from pathlib import Path
 
-from .model import OHLCVFrame, to_utc_aware
+import numpy as np
+
+from .model import OHLCVFrame, epoch_us_to_utc, to_utc_aware
+
+try:
+    import pandas as pd  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - depends on the environment
+    pd = None
 
 
 def _pick_col(fieldnames: list[str], candidates: list[str], *, required: bool) -> str | None:
@@ -18,55 +27,109 @@ def _pick_col(fieldnames: list[str], candidates: list[str], *, required: bool) -
     return None
 
 
-def _parse_timestamp(cell: str) -> datetime:
-    s = cell.strip()
+_NUMERIC_TS_RE = re.compile(r"^\d+(\.\d+)?$")
+
+
+def _parse_iso_ts(s: str) -> datetime:
     if not s:
         raise ValueError("empty timestamp")
-
-    # Numeric timestamps: seconds or milliseconds since epoch.
-    try:
-        x = float(s)
-    except ValueError:
-        x = float("nan")
-    if x == x:  # not NaN
-        if x > 1e12:
-            x /= 1000.0
-        return datetime.fromtimestamp(x, tz=timezone.utc)
-
-    # ISO-like timestamps.
     if s.endswith("Z"):
         s = s[:-1] + "+00:00"
-    dt = datetime.fromisoformat(s)
-    return to_utc_aware(dt)
-
+    return to_utc_aware(datetime.fromisoformat(s))
 
-def load_ohlcv_csv(path: Path) -> OHLCVFrame:
-    """Load an OHLCV CSV with timestamp index and optional funding/open interest.
 
-    Required columns (case-insensitive): timestamp, open, high, low, close, volume
-    Optional columns: funding, open_interest
-    """
+def _read_header(path: Path) -> list[str]:
+    with path.open("r", newline="") as f:
+        header = next(csv.reader(f), None)
+    if header is None:
+        raise ValueError("CSV must have a header row")
+    return [name for name in header if name is not None]
+
+
+def _resolve_columns(
+    fieldnames: list[str],
+    columns: Collection[str] | None = None,
+) -> tuple[str, str, str, str, str, str, str | None, str | None]:
+    ts_col = _pick_col(fieldnames, ["timestamp", "time", "date", "datetime"], required=True)
+    open_col = _pick_col(fieldnames, ["open"], required=True)
+    high_col = _pick_col(fieldnames, ["high"], required=True)
+    low_col = _pick_col(fieldnames, ["low"], required=True)
+    close_col = _pick_col(fieldnames, ["close"], required=True)
+    vol_col = _pick_col(fieldnames, ["volume", "vol"], required=True)
+    funding_col = _pick_col(
+        fieldnames,
+        ["funding", "funding_rate", "fundingrate"],
+        required=False,
+    )
+    oi_col = _pick_col(fieldnames, ["open_interest", "openinterest", "oi"], required=False)
+    # Optional columns can be dropped at load time so pipelines that never
+    # read them do not pay to parse and carry the extra float64 arrays.
+    if columns is not None:
+        if "funding" not in columns:
+            funding_col = None
+        if "open_interest" not in columns:
+            oi_col = None
+    assert ts_col and open_col and high_col and low_col and close_col and vol_col
+    return ts_col, open_col, high_col, low_col, close_col, vol_col, funding_col, oi_col
+
+
+def _load_ohlcv_csv_pandas(path: Path, columns: Collection[str] | None) -> OHLCVFrame:
+    """Fast path: delegate parsing to the pandas C engine (one pass, no per-cell float())."""
+    assert pd is not None
+    fieldnames = _read_header(path)
+    ts_col, open_col, high_col, low_col, close_col, vol_col, funding_col, oi_col = _resolve_columns(
+        fieldnames, columns
+    )
+
+    usecols = [ts_col, open_col, high_col, low_col, close_col, vol_col]
+    dtypes = {c: "float64" for c in usecols if c != ts_col}
+    if funding_col is not None:
+        usecols.append(funding_col)
+        dtypes[funding_col] = "float64"
+    if oi_col is not None:
+        usecols.append(oi_col)
+        dtypes[oi_col] = "float64"
+
+    df = pd.read_csv(path, usecols=usecols, dtype=dtypes, engine="c", memory_map=True)
+
+    # Timestamps: numeric epoch (seconds or milliseconds) or ISO-like strings,
+    # parsed in one vectorized call instead of per-row try/except.
+    num = pd.to_numeric(df[ts_col], errors="coerce")
+    if num.notna().all():
+        sec = num.where(num <= 1e12, num / 1000.0)
+        parsed = pd.to_datetime(sec, unit="s", utc=True)
+    else:
+        parsed = pd.to_datetime(df[ts_col], utc=True, format="ISO8601")
+    ts = list(parsed.dt.to_pydatetime())
+
+    funding = df[funding_col].fillna(0.0).tolist() if funding_col is not None else None
+    open_interest = df[oi_col].fillna(0.0).tolist() if oi_col is not None else None
+
+    return OHLCVFrame(
+        ts=ts,
+        open=df[open_col].tolist(),
+        high=df[high_col].tolist(),
+        low=df[low_col].tolist(),
+        close=df[close_col].tolist(),
+        volume=df[vol_col].tolist(),
+        funding=funding,
+        open_interest=open_interest,
+    )
+
+
+def _load_ohlcv_csv_stdlib(path: Path, columns: Collection[str] | None) -> OHLCVFrame:
+    """Fallback path: row-at-a-time stdlib csv parsing (no pandas required)."""
     with path.open("r", newline="") as f:
         reader = csv.DictReader(f)
         if reader.fieldnames is None:
             raise ValueError("CSV must have a header row")
         fieldnames = [name for name in reader.fieldnames if name is not None]
-
-        ts_col = _pick_col(fieldnames, ["timestamp", "time", "date", "datetime"], required=True)
-        open_col = _pick_col(fieldnames, ["open"], required=True)
-        high_col = _pick_col(fieldnames, ["high"], required=True)
-        low_col = _pick_col(fieldnames, ["low"], required=True)
-        close_col = _pick_col(fieldnames, ["close"], required=True)
-        vol_col = _pick_col(fieldnames, ["volume", "vol"], required=True)
-
-        funding_col = _pick_col(
-            fieldnames,
-            ["funding", "funding_rate", "fundingrate"],
-            required=False,
+        ts_col, open_col, high_col, low_col, close_col, vol_col, funding_col, oi_col = (
+            _resolve_columns(fieldnames, columns)
         )
-        oi_col = _pick_col(fieldnames, ["open_interest", "openinterest", "oi"], required=False)
 
         ts: list[datetime] = []
+        ts_sec: list[float] = []
         o: list[float] = []
         h: list[float] = []
         low: list[float] = []
@@ -75,13 +138,37 @@ def load_ohlcv_csv(path: Path) -> OHLCVFrame:
         funding: list[float] | None = [] if funding_col is not None else None
         open_interest: list[float] | None = [] if oi_col is not None else None
 
+        # CSV timestamp columns are uniformly numeric or uniformly ISO; probe
+        # the first row and specialize the rest of the loop so the per-row
+        # try/except format sniffing disappears. Numeric epochs (seconds or
+        # milliseconds) stay as floats and are bulk-converted to datetimes
+        # after the loop instead of one fromtimestamp call per row.
+        numeric_ts: bool | None = None
+
+        # Bind append methods once; the row count is unknown so the lists
+        # cannot be preallocated, but this drops a method lookup per cell.
+        ts_append = ts.append
+        ts_sec_append = ts_sec.append
+        o_append = o.append
+        h_append = h.append
+        low_append = low.append
+        c_append = c.append
+        v_append = v.append
+
         for row in reader:
-            ts.append(_parse_timestamp(row[ts_col]))
-            o.append(float(row[open_col]))
-            h.append(float(row[high_col]))
-            low.append(float(row[low_col]))
-            c.append(float(row[close_col]))
-            v.append(float(row[vol_col]))
+            cell = row[ts_col].strip()
+            if numeric_ts is None:
+                numeric_ts = bool(_NUMERIC_TS_RE.match(cell))
+            if numeric_ts:
+                x = float(cell)
+                ts_sec_append(x / 1000.0 if x > 1e12 else x)
+            else:
+                ts_append(_parse_iso_ts(cell))
+            o_append(float(row[open_col]))
+            h_append(float(row[high_col]))
+            low_append(float(row[low_col]))
+            c_append(float(row[close_col]))
+            v_append(float(row[vol_col]))
 
             if funding_col is not None and funding is not None:
                 cell = (row.get(funding_col) or "").strip()
@@ -90,6 +177,10 @@ def load_ohlcv_csv(path: Path) -> OHLCVFrame:
                 cell = (row.get(oi_col) or "").strip()
                 open_interest.append(float(cell) if cell else 0.0)
 
+        if ts_sec:
+            us = np.rint(np.asarray(ts_sec, dtype=np.float64) * 1e6).astype(np.int64)
+            ts = epoch_us_to_utc(us)
+
         return OHLCVFrame(
             ts=ts,
             open=o,
@@ -100,3 +191,21 @@ def load_ohlcv_csv(path: Path) -> OHLCVFrame:
             funding=funding,
             open_interest=open_interest,
         )
+
+
+def load_ohlcv_csv(path: Path, *, columns: Collection[str] | None = None) -> OHLCVFrame:
+    """Load an OHLCV CSV with timestamp index and optional funding/open interest.
+
+    Required columns (case-insensitive): timestamp, open, high, low, close, volume
+    Optional columns: funding, open_interest
+
+    ``columns`` restricts which optional columns are loaded; pass e.g.
+    ``{"open", "high", "low", "close", "volume"}`` to skip funding and open
+    interest even when the file has them. Required columns are always read.
+
+    Parsing is delegated to the pandas C engine when pandas is available;
+    otherwise the stdlib csv module is used row by row.
+    """
+    if pd is not None:
+        return _load_ohlcv_csv_pandas(path, columns)
+    return _load_ohlcv_csv_stdlib(path, columns)
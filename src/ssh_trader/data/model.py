@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-import math
-from dataclasses import dataclass
+import functools
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 
+import numpy as np
+
+_ZERO = timedelta(0)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_US = timedelta(microseconds=1)
+
 
 class Timeframe(str, Enum):
     """Timeframe identifier used for resampling / gap filling."""
@@ -19,7 +26,7 @@ class Timeframe(str, Enum):
 
     @property
     def seconds(self) -> int:
-        return parse_timeframe(self.value).seconds
+        return _TF_SECONDS[self]
 
 
 @dataclass(frozen=True, slots=True)
@@ -31,8 +38,12 @@ class ParsedTimeframe:
         return timedelta(seconds=self.seconds)
 
 
+@functools.lru_cache(maxsize=64)
 def parse_timeframe(value: str) -> ParsedTimeframe:
-    """Parse timeframe strings like ``'1h'``, ``'15m'``, ``'1d'``."""
+    """Parse timeframe strings like ``'1h'``, ``'15m'``, ``'1d'``.
+
+    Memoized: ParsedTimeframe is frozen, so cached instances are shareable.
+    """
     s = value.strip().lower()
     if not s:
         raise ValueError("timeframe is empty")
@@ -50,64 +61,100 @@ def parse_timeframe(value: str) -> ParsedTimeframe:
     return ParsedTimeframe(seconds=n * mult)
 
 
+# Resolved once; Timeframe.seconds is hit in per-bar paths.
+_TF_SECONDS = {tf: parse_timeframe(tf.value).seconds for tf in Timeframe}
+
+
 @dataclass(frozen=True, slots=True)
 class OHLCVFrame:
     """Timestamp-aligned OHLCV (+ optional series) frame.
 
-    All timestamps must be timezone-aware and normalized to UTC.
+    All timestamps must be timezone-aware and normalized to UTC. Numeric
+    columns accept any float sequence (list or ndarray) and are coerced to
+    contiguous float64 ndarrays (SoA layout) on construction.
     """
 
     ts: list[datetime]
-    open: list[float]
-    high: list[float]
-    low: list[float]
-    close: list[float]
-    volume: list[float]
-    funding: list[float] | None = None
-    open_interest: list[float] | None = None
+    open: np.ndarray | Sequence[float]
+    high: np.ndarray | Sequence[float]
+    low: np.ndarray | Sequence[float]
+    close: np.ndarray | Sequence[float]
+    volume: np.ndarray | Sequence[float]
+    funding: np.ndarray | Sequence[float] | None = None
+    open_interest: np.ndarray | Sequence[float] | None = None
+    _ts_ns: np.ndarray | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        n = len(self.ts)
-        if not (
-            len(self.open)
-            == len(self.high)
-            == len(self.low)
-            == len(self.close)
-            == len(self.volume)
-            == n
+        # Validation runs on the coerced locals: the fields stay union-typed
+        # for callers, but past this point every column is a float64 ndarray.
+        open_ = np.ascontiguousarray(self.open, dtype=np.float64)
+        high = np.ascontiguousarray(self.high, dtype=np.float64)
+        low = np.ascontiguousarray(self.low, dtype=np.float64)
+        close = np.ascontiguousarray(self.close, dtype=np.float64)
+        volume = np.ascontiguousarray(self.volume, dtype=np.float64)
+        funding = (
+            np.ascontiguousarray(self.funding, dtype=np.float64)
+            if self.funding is not None
+            else None
+        )
+        open_interest = (
+            np.ascontiguousarray(self.open_interest, dtype=np.float64)
+            if self.open_interest is not None
+            else None
+        )
+        for name, col in (
+            ("open", open_),
+            ("high", high),
+            ("low", low),
+            ("close", close),
+            ("volume", volume),
+            ("funding", funding),
+            ("open_interest", open_interest),
         ):
+            object.__setattr__(self, name, col)
+
+        n = len(self.ts)
+        if not (len(open_) == len(high) == len(low) == len(close) == len(volume) == n):
             raise ValueError("all OHLCV lists must have the same length")
-        if self.funding is not None and len(self.funding) != n:
+        if funding is not None and len(funding) != n:
             raise ValueError("funding must match ts length")
-        if self.open_interest is not None and len(self.open_interest) != n:
+        if open_interest is not None and len(open_interest) != n:
             raise ValueError("open_interest must match ts length")
 
-        for t in self.ts:
-            if t.tzinfo is None:
-                raise ValueError("timestamps must be timezone-aware")
-            if t.utcoffset() != timedelta(0):
-                raise ValueError("timestamps must be UTC-normalized")
-
-        for high_value, low_value in zip(self.high, self.low, strict=True):
-            if high_value < low_value:
-                raise ValueError("high must be >= low")
-
-        for series in (
-            self.open,
-            self.high,
-            self.low,
-            self.close,
-            self.volume,
-            (self.funding if self.funding is not None else []),
-            (self.open_interest if self.open_interest is not None else []),
-        ):
-            for v in series:
-                if not math.isfinite(v):
-                    raise ValueError("series values must be finite")
+        if any(t.tzinfo is None or t.utcoffset() != _ZERO for t in self.ts):
+            # Re-scan only to attribute the precise failure.
+            for t in self.ts:
+                if t.tzinfo is None:
+                    raise ValueError("timestamps must be timezone-aware")
+            raise ValueError("timestamps must be UTC-normalized")
+
+        if n > 0 and not bool((high >= low).all()):
+            raise ValueError("high must be >= low")
+
+        for series in (open_, high, low, close, volume, funding, open_interest):
+            if series is not None and not bool(np.isfinite(series).all()):
+                raise ValueError("series values must be finite")
 
     def __len__(self) -> int:
         return len(self.ts)
 
+    @property
+    def ts_ns(self) -> np.ndarray:
+        """Timestamps as int64 UTC epoch nanoseconds, built lazily and cached.
+
+        Numeric consumers (sorting, resampling, gap checks) should operate on
+        this array instead of re-deriving epochs from the datetime objects.
+        """
+        cached = self._ts_ns
+        if cached is None:
+            cached = np.fromiter(
+                (((t - _EPOCH) // _US) * 1000 for t in self.ts),
+                dtype=np.int64,
+                count=len(self.ts),
+            )
+            object.__setattr__(self, "_ts_ns", cached)
+        return cached
+
     def timeframe_seconds_inferred(self) -> int:
         """Infer timeframe seconds via median delta between timestamps."""
         if len(self.ts) < 3:
@@ -122,13 +169,15 @@ class OHLCVFrame:
     def copy(self) -> OHLCVFrame:
         return OHLCVFrame(
             ts=list(self.ts),
-            open=list(self.open),
-            high=list(self.high),
-            low=list(self.low),
-            close=list(self.close),
-            volume=list(self.volume),
-            funding=list(self.funding) if self.funding is not None else None,
-            open_interest=list(self.open_interest) if self.open_interest is not None else None,
+            open=np.array(self.open),
+            high=np.array(self.high),
+            low=np.array(self.low),
+            close=np.array(self.close),
+            volume=np.array(self.volume),
+            funding=np.array(self.funding) if self.funding is not None else None,
+            open_interest=(
+                np.array(self.open_interest) if self.open_interest is not None else None
+            ),
         )
 
 
@@ -136,3 +185,13 @@ def to_utc_aware(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         return dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
+
+
+def epoch_us_to_utc(epoch_us: np.ndarray) -> list[datetime]:
+    """Bulk-convert int64 epoch microseconds to aware UTC datetimes.
+
+    The datetime64 -> object cast builds all the naive datetimes in one
+    C-level pass; only attaching the UTC tzinfo remains per-element.
+    """
+    naive = np.asarray(epoch_us, dtype=np.int64).astype("datetime64[us]").astype(object)
+    return [d.replace(tzinfo=timezone.utc) for d in naive.tolist()]
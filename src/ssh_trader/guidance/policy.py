@@ -58,24 +58,26 @@ class GuidancePolicy:
 
     def __init__(self, config: GuidancePolicyConfig | None = None) -> None:
         self._config = config if config is not None else GuidancePolicyConfig()
+        # Config is frozen, so every regime's allocations are fixed at
+        # construction; targets() becomes a single dict lookup per bar.
+        cfg = self._config
+        self._picked: dict[Regime, TargetAllocations] = {
+            Regime.RISK_OFF: self._pick(cfg.risk_off_carry, cfg.risk_off_directional),
+            Regime.NEUTRAL: self._pick(cfg.neutral_carry, cfg.neutral_directional),
+            Regime.RISK_ON: self._pick(cfg.risk_on_carry, cfg.risk_on_directional),
+        }
+        self._neutral = self._picked[Regime.NEUTRAL]
+
+    def _pick(self, carry_band: AllocationBand, dir_band: AllocationBand) -> TargetAllocations:
+        a = self._config.aggressiveness
+        carry = max(0.0, min(1.0, carry_band.pick(aggressiveness=a)))
+        directional = max(0.0, min(1.0, dir_band.pick(aggressiveness=a)))
+        return TargetAllocations(carry_frac=carry, directional_frac=directional)
 
     @property
     def config(self) -> GuidancePolicyConfig:
         return self._config
 
     def targets(self, regime: Regime) -> TargetAllocations:
-        cfg = self._config
-        a = cfg.aggressiveness
-        if regime == Regime.RISK_OFF:
-            carry = cfg.risk_off_carry.pick(aggressiveness=a)
-            directional = cfg.risk_off_directional.pick(aggressiveness=a)
-        elif regime == Regime.RISK_ON:
-            carry = cfg.risk_on_carry.pick(aggressiveness=a)
-            directional = cfg.risk_on_directional.pick(aggressiveness=a)
-        else:
-            carry = cfg.neutral_carry.pick(aggressiveness=a)
-            directional = cfg.neutral_directional.pick(aggressiveness=a)
-
-        carry = max(0.0, min(1.0, carry))
-        directional = max(0.0, min(1.0, directional))
-        return TargetAllocations(carry_frac=carry, directional_frac=directional)
+        # Unknown labels fall back to neutral, as the old if/elif chain did.
+        return self._picked.get(regime, self._neutral)
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import math
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from typing import Literal
 
+import numpy as np
+
 from .venue import FillReport, MarginStatus, OrderRequest, Position, VenueAdapter
 
+_SIDE_SIGN = {"buy": 1.0, "sell": -1.0}
+
 
 @dataclass(frozen=True, slots=True)
 class HyperliquidStubConfig:
@@ -27,14 +31,26 @@ class HyperliquidStubConfig:
             raise ValueError("latency_ms must be >= 0")
         if not (0.0 < self.max_fill_ratio <= 1.0):
             raise ValueError("max_fill_ratio must be in (0, 1]")
-        if self.initial_mark_price <= 0.0 or not math.isfinite(self.initial_mark_price):
-            raise ValueError("initial_mark_price must be finite and positive")
-        if self.initial_equity <= 0.0 or not math.isfinite(self.initial_equity):
-            raise ValueError("initial_equity must be finite and positive")
-        if self.slippage_bps_at_1x_notional < 0.0 or not math.isfinite(
-            self.slippage_bps_at_1x_notional
+        for name, value, bound in (
+            ("initial_mark_price", self.initial_mark_price, "positive"),
+            ("initial_equity", self.initial_equity, "positive"),
+            ("slippage_bps_at_1x_notional", self.slippage_bps_at_1x_notional, ">= 0"),
         ):
-            raise ValueError("slippage_bps_at_1x_notional must be finite and >= 0")
+            bad = value <= 0.0 if bound == "positive" else value < 0.0
+            if bad or not math.isfinite(value):
+                raise ValueError(f"{name} must be finite and {bound}")
+
+    @classmethod
+    def unchecked(cls, **kwargs: float | int | bool | str) -> HyperliquidStubConfig:
+        """Construct without validation, for trusted callers such as parameter
+        sweeps that rebuild configs in a tight loop. Invalid values produce
+        undefined adapter behaviour; prefer the normal constructor."""
+        self = object.__new__(cls)
+        merged: dict[str, object] = {f.name: f.default for f in fields(cls)}
+        merged.update(kwargs)
+        for key, value in merged.items():
+            object.__setattr__(self, key, value)
+        return self
 
 
 class HyperliquidStubAdapter(VenueAdapter):
@@ -45,14 +61,20 @@ class HyperliquidStubAdapter(VenueAdapter):
         self._equity = self._cfg.initial_equity
         self._position_qty = 0.0
         self._order_num = 0
+        self._sim_ts: datetime | None = None
 
-    def set_market(self, *, mark_price: float, funding_rate: float) -> None:
+    def set_market(
+        self, *, mark_price: float, funding_rate: float, ts: datetime | None = None
+    ) -> None:
         if mark_price <= 0.0 or not math.isfinite(mark_price):
             raise ValueError("mark_price must be finite and positive")
         if not math.isfinite(funding_rate):
             raise ValueError("funding_rate must be finite")
         self._mark_price = mark_price
         self._funding_rate = funding_rate
+        # In replay the bar's simulated timestamp stamps fills; the wall
+        # clock is only consulted when no market ts was supplied.
+        self._sim_ts = ts
 
     def get_positions(self) -> list[Position]:
         if self._position_qty == 0.0:
@@ -68,6 +90,11 @@ class HyperliquidStubAdapter(VenueAdapter):
             )
         ]
 
+    def get_signed_position(self, symbol: str) -> float:
+        if symbol != self._cfg.symbol:
+            return 0.0
+        return self._position_qty
+
     def place_order(self, request: OrderRequest) -> FillReport:
         if self._cfg.apply_latency and self._cfg.latency_ms > 0:
             time.sleep(self._cfg.latency_ms / 1000.0)
@@ -85,12 +112,9 @@ class HyperliquidStubAdapter(VenueAdapter):
         notional_to_equity = (notional / self._equity) if self._equity > 0 else 0.0
         slippage_bps = self._cfg.slippage_bps_at_1x_notional * notional_to_equity
         slip_mult = slippage_bps / 1e4
-        if request.side == "buy":
-            fill_price = self._mark_price * (1.0 + slip_mult)
-            self._position_qty += filled_qty
-        else:
-            fill_price = self._mark_price * (1.0 - slip_mult)
-            self._position_qty -= filled_qty
+        sign = _SIDE_SIGN[request.side]
+        fill_price = self._mark_price * (1.0 + sign * slip_mult)
+        self._position_qty += sign * filled_qty
 
         return FillReport(
             order_id=order_id,
@@ -104,9 +128,37 @@ class HyperliquidStubAdapter(VenueAdapter):
             slippage_bps=slippage_bps,
             status=status,
             reason=reason,
-            ts=datetime.now(tz=timezone.utc),
+            ts=self._sim_ts if self._sim_ts is not None else datetime.now(tz=timezone.utc),
         )
 
+    def place_orders_batch(
+        self, *, signs: np.ndarray, quantities: np.ndarray, marks: np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """Fill a whole order stream in one vectorized pass (backtest replays).
+
+        ``signs`` is +1.0 for buys and -1.0 for sells. Returns arrays of
+        filled quantities, fill prices, and slippage bps; no per-order
+        FillReport objects are built. The position is advanced by the net
+        signed fill, matching a sequential place_order replay.
+        """
+        qtys = np.maximum(0.0, np.asarray(quantities, dtype=np.float64))
+        marks = np.asarray(marks, dtype=np.float64)
+        signs = np.asarray(signs, dtype=np.float64)
+
+        filled = qtys * self._cfg.max_fill_ratio
+        notional = filled * marks
+        scale = (1.0 / self._equity) if self._equity > 0 else 0.0
+        slippage_bps = self._cfg.slippage_bps_at_1x_notional * notional * scale
+        fill_price = marks * (1.0 + signs * slippage_bps / 1e4)
+
+        self._order_num += len(filled)
+        self._position_qty += float((signs * filled).sum())
+        return {
+            "filled_qty": filled,
+            "fill_price": fill_price,
+            "slippage_bps": slippage_bps,
+        }
+
     def cancel_order(self, order_id: str) -> bool:
         _ = order_id
         return True
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
 
+import numpy as np
+
 from ssh_trader.control.engine import ControlConfig, ControlDecision, ControlEngine, TargetExposure
 from ssh_trader.data.clean import fill_missing_intervals, normalize_and_sort
 from ssh_trader.data.io_csv import load_ohlcv_csv
@@ -83,34 +85,64 @@ def run_shadow(
         config=comp_cfg,
     )
 
+    n = len(frame)
+    close = np.asarray(frame.close)
+    funding_arr = (
+        np.asarray(frame.funding) if frame.funding is not None else np.zeros(n, dtype=np.float64)
+    )
+
+    # Per-bar target math is elementwise over columns already in hand, so it
+    # is computed in one vectorized pass; only the stateful venue/control
+    # calls remain inside the loop. The stub venue's equity is fixed at
+    # construction, so one margin query covers every bar.
+    equity = venue.get_margin_status().equity
+    rv = np.asarray(
+        [x if x is not None else np.nan for x in vol_feats.realized_vol], dtype=np.float64
+    )
+    vol_scale = np.minimum(1.0, cfg.target_directional_vol / np.maximum(cfg.min_realized_vol, rv))
+    vol_scale = np.where(np.isnan(vol_scale), 0.0, vol_scale)
+    dir_enabled = np.fromiter(
+        (r is Regime.RISK_ON for r in regimes), dtype=np.bool_, count=n
+    ) & np.asarray(exp, dtype=np.bool_)
+    dir_frac = np.fromiter(
+        (guidance.targets(r).directional_frac for r in regimes), dtype=np.float64, count=n
+    )
+    target_notional = equity * dir_frac * vol_scale
+    target_qty = np.divide(
+        target_notional,
+        close,
+        out=np.zeros(n, dtype=np.float64),
+        where=dir_enabled & (close > 0),
+    )
+    vol_pct_arr = np.asarray(
+        [x if x is not None else np.nan for x in vol_feats.vol_percentile], dtype=np.float64
+    )
+    vol_spike = vol_pct_arr >= cfg.vol_spike_threshold
+
+    # Timestamp strings from one bulk datetime64 format when the frame is
+    # whole-second (the usual case), as in the replay CLI; otherwise one
+    # strftime per bar.
+    ts_ns = frame.ts_ns
+    if ts_ns.size and (ts_ns % 1_000_000_000 == 0).all():
+        ts64 = (ts_ns // 1_000_000_000).astype("datetime64[s]")
+        ts_strs = np.char.add(np.datetime_as_string(ts64, unit="s"), "Z").tolist()
+    else:
+        ts_strs = [t.strftime("%Y-%m-%dT%H:%M:%S.%fZ") for t in frame.ts]
+
     logs: list[dict[str, str]] = []
     for i, ts in enumerate(frame.ts):
-        mark = frame.close[i]
-        funding = frame.funding[i] if frame.funding is not None else 0.0
-        venue.set_market(mark_price=mark, funding_rate=funding)
-
-        margin = venue.get_margin_status()
-        target_alloc = guidance.targets(regimes[i])
-        dir_vol = vol_feats.realized_vol[i]
-        vol_scale = 0.0
-        if dir_vol is not None:
-            vol_scale = min(1.0, cfg.target_directional_vol / max(cfg.min_realized_vol, dir_vol))
-        directional_enabled = regimes[i] == Regime.RISK_ON and exp[i]
-        target_notional = margin.equity * target_alloc.directional_frac * vol_scale
-        target_qty = (target_notional / mark) if directional_enabled and mark > 0 else 0.0
-        vol_pct_i = vol_feats.vol_percentile[i]
-        vol_spike_active = vol_pct_i is not None and vol_pct_i >= cfg.vol_spike_threshold
+        venue.set_market(mark_price=close[i], funding_rate=funding_arr[i], ts=ts)
 
         decision: ControlDecision = control.on_bar(
             ts=ts,
             target=TargetExposure(
-                target_perp_qty=target_qty,
-                directional_requested=directional_enabled,
+                target_perp_qty=float(target_qty[i]),
+                directional_requested=bool(dir_enabled[i]),
             ),
             regime_state=regimes[i].value,
-            oracle_price=mark,
-            vol_pct=vol_pct_i,
-            vol_spike_active=vol_spike_active,
+            oracle_price=close[i],
+            vol_pct=vol_feats.vol_percentile[i],
+            vol_spike_active=bool(vol_spike[i]),
         )
 
         intended = ""
@@ -126,7 +158,7 @@ def run_shadow(
 
         logs.append(
             {
-                "timestamp": ts.isoformat().replace("+00:00", "Z"),
+                "timestamp": ts_strs[i],
                 "regime": regimes[i].value,
                 "intended_order": intended,
                 "hypothetical_fill": hypo_fill,
@@ -193,23 +225,23 @@ def main(argv: list[str] | None = None) -> int:
         vol_spike_threshold=float(shadow_cfg.get("vol_spike_threshold", 0.90)),
     )
 
+    fieldnames = [
+        "timestamp",
+        "regime",
+        "intended_order",
+        "hypothetical_fill",
+        "slippage_estimate_bps",
+        "skipped",
+        "reason",
+        "route_hint",
+    ]
     logs = run_shadow(frame, config=runner_cfg)
     with args.output.open("w", newline="") as f:
-        w = csv.DictWriter(
-            f,
-            fieldnames=[
-                "timestamp",
-                "regime",
-                "intended_order",
-                "hypothetical_fill",
-                "slippage_estimate_bps",
-                "skipped",
-                "reason",
-                "route_hint",
-            ],
-        )
-        w.writeheader()
-        w.writerows(logs)
+        # csv.writer over positional rows skips DictWriter's per-row
+        # dict-to-list conversion and missing/extra-key bookkeeping.
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        w.writerows([log[name] for name in fieldnames] for log in logs)
     return 0
 
 
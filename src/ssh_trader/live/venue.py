@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal
+from typing import Literal, NamedTuple
 
 
 @dataclass(frozen=True, slots=True)
@@ -31,8 +31,14 @@ class OrderRequest:
     reduce_only: bool = False
 
 
-@dataclass(frozen=True, slots=True)
-class FillReport:
+class FillReport(NamedTuple):
+    """Immutable per-order fill record.
+
+    A NamedTuple rather than a frozen dataclass: fills are allocated once
+    per order in backtests, and tuple construction is several times cheaper
+    than frozen-dataclass init while keeping the same field access.
+    """
+
     order_id: str
     client_order_id: str
     symbol: str
@@ -52,6 +58,18 @@ class VenueAdapter(ABC):
     def get_positions(self) -> list[Position]:
         raise NotImplementedError
 
+    def get_signed_position(self, symbol: str) -> float:
+        """Net signed quantity for one symbol (long positive, short negative).
+
+        Adapters that track positions per symbol should override this with a
+        direct lookup; the default scans :meth:`get_positions`.
+        """
+        total = 0.0
+        for pos in self.get_positions():
+            if pos.symbol == symbol:
+                total += pos.quantity if pos.side == "long" else -pos.quantity
+        return total
+
     @abstractmethod
     def place_order(self, request: OrderRequest) -> FillReport:
         raise NotImplementedError
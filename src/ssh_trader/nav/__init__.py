@@ -13,9 +13,14 @@ from .indicators import (
 )
 from .module import NavComponent
 from .regime import Regime, RegimeConfig, classify_regimes, next_regime
+from .streaming import ATRState, EMAState, RVState, SMAState
 
 __all__ = [
+    "ATRState",
+    "EMAState",
     "NavComponent",
+    "RVState",
+    "SMAState",
     "atr",
     "CompressionConfig",
     "compression_score",
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import functools
 import math
-from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+import numpy as np
+
+from ssh_trader.utils._njit import njit
+
 from .features import volatility_features_from_close
-from .indicators import atr
+from .indicators import _to_nan_array, _to_optional_list, atr
+
+try:
+    import bottleneck as bn  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the environment
+    bn = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -49,82 +59,101 @@ class CompressionConfig:
                 raise ValueError(f"{name} must be finite and non-negative")
 
 
-def _rolling_mean(values: list[float | None], window: int) -> list[float | None]:
-    out: list[float | None] = [None] * len(values)
-    q: deque[float] = deque()
-    s = 0.0
-    for i, v in enumerate(values):
-        if v is None:
-            q.clear()
-            s = 0.0
-            continue
-        q.append(v)
-        s += v
-        if len(q) > window:
-            s -= q.popleft()
-        if len(q) == window:
-            out[i] = s / window
+def _rolling_mean(values: Sequence[float | None] | np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over full windows; NaN while the window is short or dirty.
+
+    A NaN (or None) input poisons the next ``window`` outputs, which matches
+    the old deque implementation that reset its accumulator on None.
+    """
+    arr = values if isinstance(values, np.ndarray) else _to_nan_array(values)
+    if bn is not None:
+        return bn.move_mean(arr, window, min_count=window)  # type: ignore[no-any-return]
+    out = np.full(arr.shape[0], np.nan)
+    if arr.shape[0] >= window:
+        out[window - 1 :] = np.lib.stride_tricks.sliding_window_view(arr, window).mean(axis=-1)
     return out
 
 
-def _rolling_max(values: list[float], window: int) -> list[float | None]:
-    out: list[float | None] = [None] * len(values)
-    q: deque[tuple[int, float]] = deque()
-    for i, v in enumerate(values):
-        while q and q[-1][1] <= v:
-            q.pop()
-        q.append((i, v))
-        start = i - window + 1
-        while q and q[0][0] < start:
-            q.popleft()
-        if i >= window - 1:
-            out[i] = q[0][1]
+def _rolling_max(values: Sequence[float] | np.ndarray, window: int) -> np.ndarray:
+    arr = np.asarray(values, dtype=np.float64)
+    if bn is not None:
+        return bn.move_max(arr, window, min_count=window)  # type: ignore[no-any-return]
+    out = np.full(arr.shape[0], np.nan)
+    if arr.shape[0] >= window:
+        out[window - 1 :] = np.lib.stride_tricks.sliding_window_view(arr, window).max(axis=-1)
     return out
 
 
-def _rolling_min(values: list[float], window: int) -> list[float | None]:
-    out: list[float | None] = [None] * len(values)
-    q: deque[tuple[int, float]] = deque()
-    for i, v in enumerate(values):
-        while q and q[-1][1] >= v:
-            q.pop()
-        q.append((i, v))
-        start = i - window + 1
-        while q and q[0][0] < start:
-            q.popleft()
-        if i >= window - 1:
-            out[i] = q[0][1]
+def _rolling_min(values: Sequence[float] | np.ndarray, window: int) -> np.ndarray:
+    arr = np.asarray(values, dtype=np.float64)
+    if bn is not None:
+        return bn.move_min(arr, window, min_count=window)  # type: ignore[no-any-return]
+    out = np.full(arr.shape[0], np.nan)
+    if arr.shape[0] >= window:
+        out[window - 1 :] = np.lib.stride_tricks.sliding_window_view(arr, window).min(axis=-1)
     return out
 
 
-def compression_score(
-    *,
-    high: list[float],
-    low: list[float],
-    close: list[float],
-    config: CompressionConfig | None = None,
-) -> tuple[list[float | None], list[float | None]]:
-    """Compute compression score and rolling compression range width.
-
-    Score is a weighted average of:
-    - ATR contraction vs its trailing mean
-    - range (high-low) contraction vs its trailing mean
-    - volatility percentile below a threshold
+@njit(cache=True)
+def _fused_score(
+    high: np.ndarray,
+    low: np.ndarray,
+    atr_arr: np.ndarray,
+    atr_mean: np.ndarray,
+    rng_mean: np.ndarray,
+    vol_arr: np.ndarray,
+    thr: float,
+    w_atr: float,
+    w_rng: float,
+    w_vol: float,
+) -> np.ndarray:
+    """Fused clip-and-blend pass over all three score components.
+
+    One register-resident loop in place of the chain of whole-array
+    clip/nan_to_num/isfinite ops, so long histories stream through memory
+    once instead of per stage.
     """
-    if not (len(high) == len(low) == len(close)):
-        raise ValueError("high/low/close must have equal length")
-    if not close:
-        return [], []
+    n = high.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        num = 0.0
+        weight = 0.0
+        am = atr_mean[i]
+        a = atr_arr[i]
+        if am > 0.0 and not np.isnan(a):
+            comp = 1.0 - a / am
+            num += w_atr * min(1.0, max(0.0, comp))
+            weight += w_atr
+        rm = rng_mean[i]
+        if rm > 0.0:
+            comp = 1.0 - (high[i] - low[i]) / rm
+            num += w_rng * min(1.0, max(0.0, comp))
+            weight += w_rng
+        v = vol_arr[i]
+        if not np.isnan(v):
+            comp = (thr - v) / thr
+            num += w_vol * min(1.0, max(0.0, comp))
+            weight += w_vol
+        out[i] = num / weight if weight > 0.0 else np.nan
+    return out
 
-    if config is None:
-        config = CompressionConfig()
 
-    atr_series = atr(high, low, close, window=config.atr_window, smoothing="wilder")
-    atr_mean = _rolling_mean(atr_series, window=config.contraction_lookback)
+@functools.lru_cache(maxsize=128)
+def _compression_score_cached(
+    high_bytes: bytes,
+    low_bytes: bytes,
+    close_bytes: bytes,
+    config: CompressionConfig,
+) -> tuple[list[float | None], list[float | None]]:
+    h = np.frombuffer(high_bytes, dtype=np.float64)
+    lo = np.frombuffer(low_bytes, dtype=np.float64)
+    high: list[float] = h.tolist()
+    low: list[float] = lo.tolist()
+    close: list[float] = np.frombuffer(close_bytes, dtype=np.float64).tolist()
 
-    rng = [hi - lo for hi, lo in zip(high, low, strict=True)]
-    rng_opt: list[float | None] = [float(x) for x in rng]
-    rng_mean = _rolling_mean(rng_opt, window=config.contraction_lookback)
+    atr_series = atr(high, low, close, window=config.atr_window, smoothing="wilder")
+    atr_mean_arr = _rolling_mean(atr_series, window=config.contraction_lookback)
+    rng_mean_arr = _rolling_mean(h - lo, window=config.contraction_lookback)
 
     vol_feats = volatility_features_from_close(
         close=close,
@@ -133,63 +162,78 @@ def compression_score(
         annualization_factor=1.0,
         demean=False,
     )
-    vol_pct = vol_feats.vol_percentile
 
     w_sum = config.weight_atr + config.weight_range + config.weight_vol
     w_atr = config.weight_atr / w_sum if w_sum > 0 else 0.0
     w_rng = config.weight_range / w_sum if w_sum > 0 else 0.0
     w_vol = config.weight_vol / w_sum if w_sum > 0 else 0.0
 
-    score: list[float | None] = [None] * len(close)
-    for i in range(len(close)):
-        comp = 0.0
-        weight = 0.0
+    # Components are unavailable (and excluded from the blend) where their
+    # rolling mean is not yet warm or the percentile is NaN; the fused
+    # kernel mirrors the old conditional accumulation per index.
+    score_arr = _fused_score(
+        h,
+        lo,
+        _to_nan_array(atr_series),
+        atr_mean_arr,
+        rng_mean_arr,
+        _to_nan_array(vol_feats.vol_percentile),
+        config.vol_pct_low_threshold,
+        w_atr,
+        w_rng,
+        w_vol,
+    )
 
-        atr_i = atr_series[i]
-        atr_m = atr_mean[i]
-        if atr_i is not None and atr_m is not None and atr_m > 0:
-            ratio = atr_i / atr_m
-            atr_comp = max(0.0, min(1.0, 1.0 - ratio))
-            comp += w_atr * atr_comp
-            weight += w_atr
+    hi_roll = _rolling_max(high, window=config.range_window)
+    lo_roll = _rolling_min(low, window=config.range_window)
+    return _to_optional_list(score_arr), _to_optional_list(hi_roll - lo_roll)
 
-        rng_m = rng_mean[i]
-        if rng_m is not None and rng_m > 0:
-            ratio = rng[i] / rng_m
-            rng_comp = max(0.0, min(1.0, 1.0 - ratio))
-            comp += w_rng * rng_comp
-            weight += w_rng
 
-        vol_p = vol_pct[i]
-        if vol_p is not None:
-            vol_comp = max(
-                0.0,
-                min(1.0, (config.vol_pct_low_threshold - vol_p) / config.vol_pct_low_threshold),
-            )
-            comp += w_vol * vol_comp
-            weight += w_vol
+def compression_score(
+    *,
+    high: Sequence[float] | np.ndarray,
+    low: Sequence[float] | np.ndarray,
+    close: Sequence[float] | np.ndarray,
+    config: CompressionConfig | None = None,
+) -> tuple[list[float | None], list[float | None]]:
+    """Compute compression score and rolling compression range width.
 
-        if weight > 0.0:
-            score[i] = comp / weight
+    Score is a weighted average of:
+    - ATR contraction vs its trailing mean
+    - range (high-low) contraction vs its trailing mean
+    - volatility percentile below a threshold
 
-    hi_roll = _rolling_max(high, window=config.range_window)
-    lo_roll = _rolling_min(low, window=config.range_window)
-    width: list[float | None] = [None] * len(close)
-    for i in range(len(close)):
-        hi_i = hi_roll[i]
-        lo_i = lo_roll[i]
-        if hi_i is None or lo_i is None:
-            continue
-        width[i] = hi_i - lo_i
+    Results are memoized on the raw series bytes plus the (frozen, hence
+    hashable) config, since parameter sweeps rescore identical frames;
+    callers get fresh list copies.
+    """
+    if not (len(high) == len(low) == len(close)):
+        raise ValueError("high/low/close must have equal length")
+    if len(close) == 0:
+        return [], []
+
+    if config is None:
+        config = CompressionConfig()
+
+    score, width = _compression_score_cached(
+        np.asarray(high, dtype=np.float64).tobytes(),
+        np.asarray(low, dtype=np.float64).tobytes(),
+        np.asarray(close, dtype=np.float64).tobytes(),
+        config,
+    )
+    return list(score), list(width)
 
-    return score, width
+
+def clear_cache() -> None:
+    """Drop memoized compression scores (mainly for tests and long-lived sweeps)."""
+    _compression_score_cached.cache_clear()
 
 
 def expansion_trigger(
     *,
-    close: list[float],
-    high: list[float],
-    low: list[float],
+    close: Sequence[float] | np.ndarray,
+    high: Sequence[float] | np.ndarray,
+    low: Sequence[float] | np.ndarray,
     vol_pct: list[float | None],
     trend: list[int],
     score: list[float | None],
@@ -198,36 +242,32 @@ def expansion_trigger(
     """Detect bullish expansion following compression."""
     if not (len(close) == len(high) == len(low) == len(vol_pct) == len(trend) == len(score)):
         raise ValueError("all series must have equal length")
-    if not close:
+    if len(close) == 0:
         return []
 
     if config is None:
         config = CompressionConfig()
 
+    close_arr = np.asarray(close, dtype=np.float64)
+    trend_arr = np.asarray(trend, dtype=np.int64)
+    vol_arr = _to_nan_array(vol_pct)
+    score_arr = _to_nan_array(score)
     hi_roll = _rolling_max(high, window=config.range_window)
-    trigger: list[bool] = [False] * len(close)
-    compressed_confirm = 0
-    was_compressed = False
-    for i in range(len(close)):
-        s = score[i]
-        if s is not None and s >= config.score_trigger:
-            compressed_confirm += 1
-        else:
-            compressed_confirm = 0
-        if compressed_confirm >= config.breakout_confirm:
-            was_compressed = True
-
-        if i == 0:
-            continue
-        prev_hi = hi_roll[i - 1]
-        v = vol_pct[i]
-        if prev_hi is None or v is None:
-            continue
-        if (
-            was_compressed
-            and close[i] > prev_hi
-            and v >= config.vol_expand_threshold
-            and trend[i] > 0
-        ):
-            trigger[i] = True
+
+    # was_compressed: latched once score >= trigger for breakout_confirm
+    # consecutive bars. The run length is index minus the last miss index.
+    n = len(close)
+    idx = np.arange(n)
+    with np.errstate(invalid="ignore"):
+        score_ok = score_arr >= config.score_trigger
+    last_miss = np.maximum.accumulate(np.where(score_ok, -1, idx))
+    run = np.where(score_ok, idx - last_miss, 0)
+    was_compressed = np.maximum.accumulate(run >= config.breakout_confirm)
+
+    # Stateless breakout conditions against the previous bar's rolling high;
+    # NaN comparisons are False, which covers the old None/warm-up skips.
+    prev_hi = np.concatenate(([np.nan], hi_roll[:-1]))
+    with np.errstate(invalid="ignore"):
+        base = (close_arr > prev_hi) & (vol_arr >= config.vol_expand_threshold) & (trend_arr > 0)
+    trigger: list[bool] = (base & was_compressed).tolist()
     return trigger
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import functools
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Literal
 
-from .indicators import ema, log_returns, realized_volatility, sma, volatility_percentile
+import numpy as np
+
+from .indicators import (
+    _to_nan_array,
+    _to_optional_list,
+    ema,
+    log_returns,
+    realized_volatility,
+    sma,
+    volatility_percentile,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -16,7 +28,7 @@ class VolatilityFeatures:
 
 def trend_signal(
     *,
-    close: list[float],
+    close: Sequence[float] | np.ndarray,
     method: Literal["sma", "ema"],
     window_or_span: int,
     band: float = 0.0,
@@ -25,38 +37,33 @@ def trend_signal(
         raise ValueError("window_or_span must be positive")
     if band < 0.0 or not math.isfinite(band):
         raise ValueError("band must be finite and non-negative")
-    if not close:
+    if len(close) == 0:
         return []
 
+    close_arr = np.asarray(close, dtype=np.float64)
     if method == "ema":
-        ma: list[float | None] = [float(x) for x in ema(close, span=window_or_span)]
+        ma = np.asarray(ema(close, span=window_or_span), dtype=np.float64)
     else:
-        ma = sma(close, window=window_or_span)
-
-    out: list[int] = []
-    for c, m in zip(close, ma, strict=True):
-        if m is None:
-            out.append(0)
-        elif c > m * (1.0 + band):
-            out.append(1)
-        elif c < m * (1.0 - band):
-            out.append(-1)
-        else:
-            out.append(0)
+        ma = _to_nan_array(sma(close, window=window_or_span))
+
+    # NaN comparisons are False, so warm-up bars land in the 0 branch just
+    # like the old explicit None check.
+    with np.errstate(invalid="ignore"):
+        up = close_arr > ma * (1.0 + band)
+        down = close_arr < ma * (1.0 - band)
+    out: list[int] = np.where(up, 1, np.where(down, -1, 0)).tolist()
     return out
 
 
-def volatility_features_from_close(
-    *,
-    close: list[float],
+@functools.lru_cache(maxsize=128)
+def _volatility_features_cached(
+    close_bytes: bytes,
     rv_window: int,
     vol_percentile_window: int,
-    annualization_factor: float = 1.0,
-    demean: bool = False,
+    annualization_factor: float,
+    demean: bool,
 ) -> VolatilityFeatures:
-    if not close:
-        return VolatilityFeatures(log_returns=[], realized_vol=[], vol_percentile=[])
-
+    close: list[float] = np.frombuffer(close_bytes, dtype=np.float64).tolist()
     rets = log_returns(close)
     rv = realized_volatility(
         rets,
@@ -65,17 +72,52 @@ def volatility_features_from_close(
         demean=demean,
     )
 
-    rv_aligned: list[float | None] = [None]
-    rv_aligned.extend(rv)
+    # Align realized vol to close (returns start one bar later), then rank
+    # only the finite stretch and scatter the ranks back by index.
+    rv_aligned = np.concatenate(([np.nan], _to_nan_array(rv)))
+    finite_idx = np.flatnonzero(np.isfinite(rv_aligned))
+
+    vol_pct = np.full(len(close), np.nan)
+    if finite_idx.size:
+        ranks = volatility_percentile(rv_aligned[finite_idx].tolist(), window=vol_percentile_window)
+        vol_pct[finite_idx] = _to_nan_array(ranks)
+
+    return VolatilityFeatures(
+        log_returns=rets,
+        realized_vol=_to_optional_list(rv_aligned),
+        vol_percentile=_to_optional_list(vol_pct),
+    )
+
 
-    rv_vals = [v for v in rv_aligned if v is not None]
-    vol_pct_vals = volatility_percentile(rv_vals, window=vol_percentile_window)
+def volatility_features_from_close(
+    *,
+    close: Sequence[float] | np.ndarray,
+    rv_window: int,
+    vol_percentile_window: int,
+    annualization_factor: float = 1.0,
+    demean: bool = False,
+) -> VolatilityFeatures:
+    if len(close) == 0:
+        return VolatilityFeatures(log_returns=[], realized_vol=[], vol_percentile=[])
+
+    # Parameter sweeps replay the same close vector many times, so results
+    # are memoized on the raw bytes of the series plus the parameters.
+    # Fresh list copies are handed out so a caller mutating its result
+    # cannot poison the cache.
+    cached = _volatility_features_cached(
+        np.asarray(close, dtype=np.float64).tobytes(),
+        rv_window,
+        vol_percentile_window,
+        annualization_factor,
+        demean,
+    )
+    return VolatilityFeatures(
+        log_returns=list(cached.log_returns),
+        realized_vol=list(cached.realized_vol),
+        vol_percentile=list(cached.vol_percentile),
+    )
 
-    vol_pct: list[float | None] = [None] * len(close)
-    start = next((i for i, v in enumerate(rv_aligned) if v is not None), len(close))
-    for i in range(start, len(close)):
-        if rv_aligned[i] is None:
-            continue
-        vol_pct[i] = vol_pct_vals[i - start]
 
-    return VolatilityFeatures(log_returns=rets, realized_vol=rv_aligned, vol_percentile=vol_pct)
+def clear_cache() -> None:
+    """Drop memoized feature results (mainly for tests and long-lived sweeps)."""
+    _volatility_features_cached.cache_clear()
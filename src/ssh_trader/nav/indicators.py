@@ -1,16 +1,50 @@
-"""Lightweight, dependency-free indicator utilities.
+"""Lightweight indicator utilities.
 
-These functions are intentionally implemented without numpy/pandas to keep the core
-library small and easy to type-check under strict mypy settings.
+These functions avoid pandas and keep their list-based APIs; numpy (a core
+dependency) is used only where a vectorized elementwise pass clearly beats
+the pure-Python loop.
 """
 
 from __future__ import annotations
 
 import math
+from bisect import bisect_left, bisect_right, insort
 from collections import deque
 from collections.abc import Sequence
 from typing import Literal
 
+import numpy as np
+
+from ssh_trader.utils._njit import njit
+
+# Elements in the transient (N-W+1, W) comparison matrix above which the
+# rolling rank switches to the constant-memory bisect path.
+_RANK_VECTOR_BUDGET = 8_000_000
+
+
+def _validate_finite(values: Sequence[float] | np.ndarray, name: str) -> np.ndarray:
+    """Convert to float64 and reject non-finite entries in one bulk check."""
+    arr = np.asarray(values, dtype=np.float64)
+    if not np.isfinite(arr).all():
+        raise ValueError(f"{name} must be finite")
+    return arr
+
+
+def _to_nan_array(values: Sequence[float | None] | np.ndarray) -> np.ndarray:
+    """None-sentinel sequence to a float64 array with NaN for missing values.
+
+    Series move through the nav pipeline as contiguous NaN-sentinel arrays;
+    the ``list[float | None]`` form only appears at the public boundaries.
+    """
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    return np.asarray([v if v is not None else np.nan for v in values], dtype=np.float64)
+
+
+def _to_optional_list(arr: np.ndarray) -> list[float | None]:
+    """Float64 NaN-sentinel array back to the None-sentinel list API."""
+    return [None if math.isnan(v) else v for v in arr.tolist()]
+
 
 def log_returns(prices: Sequence[float]) -> list[float]:
     """Compute log returns ln(p_t / p_{t-1}) for a price series.
@@ -20,20 +54,30 @@ def log_returns(prices: Sequence[float]) -> list[float]:
     if len(prices) < 2:
         return []
 
-    out: list[float] = []
-    prev = prices[0]
-    if prev <= 0.0 or not math.isfinite(prev):
+    arr = np.asarray(prices, dtype=np.float64)
+    if (arr <= 0.0).any() or not np.isfinite(arr).all():
         raise ValueError("prices must be finite and strictly positive")
+    out: list[float] = np.log(arr[1:] / arr[:-1]).tolist()
+    return out
 
-    for price in prices[1:]:
-        if price <= 0.0 or not math.isfinite(price):
-            raise ValueError("prices must be finite and strictly positive")
-        out.append(math.log(price / prev))
-        prev = price
+
+@njit(cache=True)
+def _sma_loop(x: np.ndarray, window: int) -> np.ndarray:
+    """Running-sum rolling mean; NaN during warm-up."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    inv_w = 1.0 / window
+    acc = 0.0
+    for i in range(n):
+        acc += x[i]
+        if i >= window:
+            acc -= x[i - window]
+        if i >= window - 1:
+            out[i] = acc * inv_w
     return out
 
 
-def sma(values: Sequence[float], window: int) -> list[float | None]:
+def sma(values: Sequence[float] | np.ndarray, window: int) -> list[float | None]:
     """Simple moving average over a rolling window.
 
     For indices with insufficient history, the result is ``None``.
@@ -41,48 +85,34 @@ def sma(values: Sequence[float], window: int) -> list[float | None]:
     if window <= 0:
         raise ValueError("window must be positive")
 
-    out: list[float | None] = [None] * len(values)
-    running_sum = 0.0
-    q: deque[float] = deque()
-
-    for idx, value in enumerate(values):
-        if not math.isfinite(value):
-            raise ValueError("values must be finite")
-
-        q.append(value)
-        running_sum += value
-
-        if len(q) > window:
-            running_sum -= q.popleft()
+    arr = _validate_finite(values, "values")
+    return _to_optional_list(_sma_loop(arr, window))
 
-        if len(q) == window:
-            out[idx] = running_sum / window
 
-    return out
+@njit(cache=True)
+def _ema_loop(x: np.ndarray, alpha: float) -> np.ndarray:
+    """First-order IIR recursion; sequential, so jitted rather than vectorized."""
+    y = np.empty_like(x)
+    prev = x[0]
+    y[0] = prev
+    for i in range(1, x.shape[0]):
+        prev = prev + alpha * (x[i] - prev)
+        y[i] = prev
+    return y
 
 
-def ema(values: Sequence[float], span: int) -> list[float]:
+def ema(values: Sequence[float] | np.ndarray, span: int) -> list[float]:
     """Exponential moving average using standard ``alpha = 2 / (span + 1)``.
 
     The first EMA value is seeded with the first observation (no warm-up Nones).
     """
     if span <= 0:
         raise ValueError("span must be positive")
-    if not values:
+    if len(values) == 0:
         return []
 
-    alpha = 2.0 / (span + 1.0)
-    first = values[0]
-    if not math.isfinite(first):
-        raise ValueError("values must be finite")
-
-    out: list[float] = [first]
-    prev = first
-    for value in values[1:]:
-        if not math.isfinite(value):
-            raise ValueError("values must be finite")
-        prev = prev + alpha * (value - prev)
-        out.append(prev)
+    arr = _validate_finite(values, "values")
+    out: list[float] = _ema_loop(arr, 2.0 / (span + 1.0)).tolist()
     return out
 
 
@@ -90,36 +120,42 @@ def _true_ranges(
     high: Sequence[float],
     low: Sequence[float],
     close: Sequence[float],
-) -> list[float]:
+) -> np.ndarray:
     if not (len(high) == len(low) == len(close)):
         raise ValueError("high/low/close must have the same length")
-    if not high:
-        return []
-
-    tr: list[float] = []
-    prev_close = close[0]
-    for idx, (high_value, low_value, close_value) in enumerate(zip(high, low, close, strict=True)):
-        if not (
-            math.isfinite(high_value) and math.isfinite(low_value) and math.isfinite(close_value)
-        ):
-            raise ValueError("high/low/close must be finite")
-        if high_value < low_value:
-            raise ValueError("high must be >= low")
-
-        if idx == 0:
-            tr.append(high_value - low_value)
-        else:
-            tr.append(
-                max(
-                    high_value - low_value,
-                    abs(high_value - prev_close),
-                    abs(low_value - prev_close),
-                )
-            )
-        prev_close = close_value
+    if len(high) == 0:
+        return np.empty(0, dtype=np.float64)
+
+    h = _validate_finite(high, "high/low/close")
+    lo = _validate_finite(low, "high/low/close")
+    c = _validate_finite(close, "high/low/close")
+    if (h < lo).any():
+        raise ValueError("high must be >= low")
+
+    prev_c = np.concatenate(([c[0]], c[:-1]))
+    tr: np.ndarray = np.maximum.reduce([h - lo, np.abs(h - prev_c), np.abs(lo - prev_c)])
+    tr[0] = h[0] - lo[0]
     return tr
 
 
+@njit(cache=True)
+def _wilder_atr(tr: np.ndarray, window: int) -> np.ndarray:
+    """Wilder smoothing of true ranges; returns values from index window-1 on."""
+    n = tr.shape[0]
+    y = np.empty(n - window + 1, dtype=np.float64)
+    acc = 0.0
+    for i in range(window):
+        acc += tr[i]
+    inv_w = 1.0 / window
+    w_less_1 = window - 1.0
+    prev = acc * inv_w
+    y[0] = prev
+    for i in range(window, n):
+        prev = (prev * w_less_1 + tr[i]) * inv_w
+        y[i - window + 1] = prev
+    return y
+
+
 def atr(
     high: Sequence[float],
     low: Sequence[float],
@@ -137,24 +173,17 @@ def atr(
         raise ValueError("window must be positive")
 
     tr = _true_ranges(high, low, close)
-    if not tr:
+    if tr.shape[0] == 0:
         return []
 
     if smoothing == "sma":
-        return sma(tr, window)
+        return sma(tr.tolist(), window)
 
-    out: list[float | None] = [None] * len(tr)
-    if len(tr) < window:
+    out: list[float | None] = [None] * tr.shape[0]
+    if tr.shape[0] < window:
         return out
 
-    first_atr = sum(tr[:window]) / window
-    out[window - 1] = first_atr
-    prev_atr = first_atr
-
-    for idx in range(window, len(tr)):
-        prev_atr = (prev_atr * (window - 1) + tr[idx]) / window
-        out[idx] = prev_atr
-
+    out[window - 1 :] = _wilder_atr(tr, window).tolist()
     return out
 
 
@@ -175,32 +204,24 @@ def realized_volatility(
     if annualization_factor <= 0.0 or not math.isfinite(annualization_factor):
         raise ValueError("annualization_factor must be finite and positive")
 
-    out: list[float | None] = [None] * len(returns)
-    q: deque[float] = deque()
-    sum_r = 0.0
-    sum_r2 = 0.0
-
-    for idx, r in enumerate(returns):
-        if not math.isfinite(r):
-            raise ValueError("returns must be finite")
-
-        q.append(r)
-        sum_r += r
-        sum_r2 += r * r
-
-        if len(q) > window:
-            old = q.popleft()
-            sum_r -= old
-            sum_r2 -= old * old
-
-        if len(q) == window:
-            if demean:
-                mean_r = sum_r / window
-                var = max(0.0, (sum_r2 / window) - mean_r * mean_r)
-            else:
-                var = sum_r2 / window
-            out[idx] = math.sqrt(var) * math.sqrt(annualization_factor)
-
+    n = len(returns)
+    arr = _validate_finite(returns, "returns")
+    if n < window:
+        return [None] * n
+
+    # Rolling sums via cumulative-sum differencing: one C pass each instead
+    # of a running add/subtract loop. Cancellation can push the variance a
+    # hair below zero, hence the clip before the sqrt.
+    c2 = np.concatenate(([0.0], np.cumsum(arr * arr)))
+    var = (c2[window:] - c2[:-window]) / window
+    if demean:
+        c1 = np.concatenate(([0.0], np.cumsum(arr)))
+        mean_r = (c1[window:] - c1[:-window]) / window
+        var = var - mean_r * mean_r
+    vol = np.sqrt(np.clip(var, 0.0, None)) * math.sqrt(annualization_factor)
+
+    out: list[float | None] = [None] * (window - 1)
+    out.extend(vol.tolist())
     return out
 
 
@@ -213,42 +234,45 @@ def volatility_percentile(volatility: Sequence[float], window: int) -> list[floa
     if window <= 0:
         raise ValueError("window must be positive")
 
-    out: list[float | None] = [None] * len(volatility)
-    q: deque[float] = deque()
+    n = len(volatility)
+    arr = _validate_finite(volatility, "volatility")
+    out: list[float | None] = [None] * n
+    if n < window:
+        return out
+
+    if n * window <= _RANK_VECTOR_BUDGET:
+        # Zero-copy window view plus one boolean comparison against each
+        # window's last element: O(N*W) work but all of it C-level.
+        windows = np.lib.stride_tricks.sliding_window_view(arr, window)
+        pct = (windows <= windows[:, -1:]).sum(axis=1, dtype=np.int64) / window
+        out[window - 1 :] = pct.tolist()
+        return out
 
+    # For very long series/windows the O(N*W) comparison matrix is too much
+    # transient memory; fall back to a sorted mirror of the window where the
+    # rank is a single bisect per step.
+    q: deque[float] = deque()
+    ordered: list[float] = []
     for idx, v in enumerate(volatility):
-        if not math.isfinite(v):
-            raise ValueError("volatility must be finite")
         q.append(v)
+        insort(ordered, v)
         if len(q) > window:
-            q.popleft()
+            del ordered[bisect_left(ordered, q.popleft())]
 
         if len(q) == window:
-            current = q[-1]
-            count_le = sum(1 for x in q if x <= current)
-            out[idx] = count_le / window
+            out[idx] = bisect_right(ordered, v) / window
 
     return out
 
 
 def drawdown(values: Sequence[float]) -> list[float]:
     """Compute drawdown series (value / peak - 1)."""
-    if not values:
+    if len(values) == 0:
         return []
 
-    out: list[float] = []
-    peak = values[0]
-    if not math.isfinite(peak):
-        raise ValueError("values must be finite")
-    out.append(0.0)
-
-    for value in values[1:]:
-        if not math.isfinite(value):
-            raise ValueError("values must be finite")
-        if value > peak:
-            peak = value
-        out.append((value / peak) - 1.0)
-
+    arr = _validate_finite(values, "values")
+    peak = np.maximum.accumulate(arr)
+    out: list[float] = ((arr / peak) - 1.0).tolist()
     return out
 
 
@@ -259,27 +283,28 @@ def rolling_drawdown(values: Sequence[float], window: int) -> list[float | None]
     """
     if window <= 0:
         raise ValueError("window must be positive")
-    if not values:
+    if len(values) == 0:
         return []
 
-    out: list[float | None] = [None] * len(values)
-
-    # Monotonic deque of candidate peaks: (index, value) decreasing by value.
-    q: deque[tuple[int, float]] = deque()
-    for i, v in enumerate(values):
-        if not math.isfinite(v):
-            raise ValueError("values must be finite")
-
-        while q and q[-1][1] <= v:
-            q.pop()
-        q.append((i, v))
-
-        start = i - window + 1
-        while q and q[0][0] < start:
-            q.popleft()
-
+    arr = _validate_finite(values, "values")
+    return _to_optional_list(_rolling_drawdown_loop(arr, window))
+
+
+@njit(cache=True)
+def _rolling_drawdown_loop(x: np.ndarray, window: int) -> np.ndarray:
+    """Monotonic deque of candidate peak indices, decreasing by value."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    dq = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        while tail > head and x[dq[tail - 1]] <= x[i]:
+            tail -= 1
+        dq[tail] = i
+        tail += 1
+        if dq[head] <= i - window:
+            head += 1
         if i >= window - 1:
-            peak = q[0][1]
-            out[i] = (v / peak) - 1.0
-
+            out[i] = (x[i] / x[dq[head]]) - 1.0
     return out
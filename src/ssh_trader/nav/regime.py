@@ -14,11 +14,16 @@ Inputs (per bar):
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 from typing import Literal
 
-from .features import trend_signal, volatility_features_from_close
+import numpy as np
+
+from ssh_trader.utils._njit import njit
+
+from .features import VolatilityFeatures, trend_signal, volatility_features_from_close
 
 
 class Regime(str, Enum):
@@ -75,19 +80,20 @@ class RegimeConfig:
             raise ValueError("funding_mode must be 'ignore' or 'sign'")
 
 
-def _funding_sign_series(funding: list[float] | None) -> list[int] | None:
+# Integer codes for the classify_regimes state machine; the Regime enum is
+# only materialized once per bar on the way out.
+_NEUTRAL_C, _RISK_ON_C, _RISK_OFF_C = 0, 1, 2
+_CODE_TO_REGIME = (Regime.NEUTRAL, Regime.RISK_ON, Regime.RISK_OFF)
+_REGIME_TO_CODE = {r: c for c, r in enumerate(_CODE_TO_REGIME)}
+
+
+def _funding_sign_series(funding: Sequence[float] | np.ndarray | None) -> list[int] | None:
     if funding is None:
         return None
-    out: list[int] = []
-    for f in funding:
-        if not math.isfinite(f):
-            raise ValueError("funding must be finite")
-        if f > 0.0:
-            out.append(1)
-        elif f < 0.0:
-            out.append(-1)
-        else:
-            out.append(0)
+    arr = np.asarray(funding, dtype=np.float64)
+    if not np.isfinite(arr).all():
+        raise ValueError("funding must be finite")
+    out: list[int] = np.sign(arr).astype(np.int64).tolist()
     return out
 
 
@@ -144,21 +150,85 @@ def next_regime(
     return tentative
 
 
-def classify_regimes(
+@njit(cache=True)
+def _resolve_codes(
+    desired_all: np.ndarray,
+    valid: np.ndarray,
+    initial_c: int,
+    confirm_bars: int,
+) -> np.ndarray:
+    """Walk the desired-state table applying hysteresis confirmation."""
+    n = desired_all.shape[1]
+    codes = np.empty(n, dtype=np.int8)
+    prev_c = initial_c
+    pending = -1
+    pending_count = 0
+    for i in range(n):
+        if not valid[i]:
+            codes[i] = prev_c
+            pending = -1
+            pending_count = 0
+            continue
+
+        desired_c = desired_all[prev_c, i]
+
+        if desired_c == prev_c:
+            codes[i] = prev_c
+            pending = -1
+            pending_count = 0
+            continue
+
+        # Risk-off is conservative: allow immediate transition on trigger.
+        if desired_c == _RISK_OFF_C:
+            prev_c = _RISK_OFF_C
+            codes[i] = prev_c
+            pending = -1
+            pending_count = 0
+            continue
+
+        if pending == desired_c:
+            pending_count += 1
+        else:
+            pending = desired_c
+            pending_count = 1
+
+        if pending_count >= confirm_bars:
+            prev_c = int(desired_c)
+            pending = -1
+            pending_count = 0
+
+        codes[i] = prev_c
+
+    return codes
+
+
+def decode_regimes(codes: np.ndarray) -> list[Regime]:
+    """Expand an int8 regime-code array back into :class:`Regime` labels."""
+    return [_CODE_TO_REGIME[c] for c in codes.tolist()]
+
+
+def classify_regime_codes(
     *,
-    close: list[float],
-    high: list[float] | None = None,
-    low: list[float] | None = None,
-    funding: list[float] | None = None,
+    close: Sequence[float] | np.ndarray,
+    high: Sequence[float] | np.ndarray | None = None,
+    low: Sequence[float] | np.ndarray | None = None,
+    funding: Sequence[float] | np.ndarray | None = None,
     config: RegimeConfig | None = None,
     initial: Regime = Regime.NEUTRAL,
-) -> list[Regime]:
-    """Compute a regime label for each close.
+    trend: list[int] | None = None,
+    vol_feats: VolatilityFeatures | None = None,
+) -> np.ndarray:
+    """Compute a regime code per close as an int8 array.
+
+    Codes are 0=NEUTRAL, 1=RISK_ON, 2=RISK_OFF (see ``decode_regimes``).
+    This is the storage-friendly entry point for long histories: an int8
+    per bar instead of an enum object. Notes:
 
-    Notes:
     - Realized volatility is computed from log returns of close.
     - Volatility percentile uses a trailing window on the realized volatility series.
     - ``high``/``low`` are accepted for future extensions but not required by this classifier.
+    - Callers that already hold ``trend``/``vol_feats`` computed with this
+      config's parameters may pass them to skip the recomputation.
     """
     if high is not None and len(high) != len(close):
         raise ValueError("high must match close length")
@@ -167,76 +237,83 @@ def classify_regimes(
     if funding is not None and len(funding) != len(close):
         raise ValueError("funding must match close length")
 
-    if not close:
-        return []
+    if len(close) == 0:
+        return np.empty(0, dtype=np.int8)
 
     if config is None:
         config = RegimeConfig()
 
-    trend = trend_signal(
-        close=close,
-        method=config.trend_method,
-        window_or_span=(
-            config.long_ma_window if config.trend_method == "sma" else config.trend_span
-        ),
-        band=config.trend_band,
-    )
-    vol_feats = volatility_features_from_close(
-        close=close,
-        rv_window=config.rv_window,
-        vol_percentile_window=config.vol_percentile_window,
-        annualization_factor=config.annualization_factor,
-        demean=False,
-    )
-    vol_pct_full = vol_feats.vol_percentile
-
+    if trend is None:
+        trend = trend_signal(
+            close=close,
+            method=config.trend_method,
+            window_or_span=(
+                config.long_ma_window if config.trend_method == "sma" else config.trend_span
+            ),
+            band=config.trend_band,
+        )
+    if vol_feats is None:
+        vol_feats = volatility_features_from_close(
+            close=close,
+            rv_window=config.rv_window,
+            vol_percentile_window=config.vol_percentile_window,
+            annualization_factor=config.annualization_factor,
+            demean=False,
+        )
     funding_sign = _funding_sign_series(funding) if config.funding_mode != "ignore" else None
 
-    regimes: list[Regime] = []
-    prev = initial
-    pending: Regime | None = None
-    pending_count = 0
-    for i in range(len(close)):
-        v = vol_pct_full[i]
-        if v is None or trend[i] == 0:
-            regimes.append(prev)
-            pending = None
-            pending_count = 0
-            continue
+    # All of next_regime's deterministic branches are precomputed as masks;
+    # the loop below only resolves the state-dependent hysteresis and the
+    # confirm counter. NaN vol bars are filtered by the valid mask, so the
+    # NaN comparison warnings are suppressed.
+    trend_np = np.asarray(trend, dtype=np.int8)
+    vol_np = np.asarray(
+        [np.nan if v is None else v for v in vol_feats.vol_percentile], dtype=np.float64
+    )
+    with np.errstate(invalid="ignore"):
+        valid = np.isfinite(vol_np) & (trend_np != 0)
+        trigger_off = vol_np >= config.risk_off_vol_pct_min
+        stay_on = (trend_np >= 0) & (vol_np <= config.risk_on_exit_vol_pct)
+        stay_off = vol_np >= config.risk_off_exit_vol_pct
+        tentative_on = (trend_np > 0) & (vol_np <= config.risk_on_vol_pct_max)
+    if funding_sign is not None:
+        # Positive funding demotes a tentative risk-on, as in next_regime.
+        tentative_on &= np.asarray(funding_sign, dtype=np.int8) <= 0
+
+    # Collapse the masks into a (previous state, bar) -> desired-state table
+    # so each loop iteration is one gather; only the hysteresis confirm
+    # counter remains branchy.
+    n = len(close)
+    desired_all = np.empty((3, n), dtype=np.int8)
+    desired_all[_NEUTRAL_C] = np.where(tentative_on, _RISK_ON_C, _NEUTRAL_C)
+    desired_all[_RISK_ON_C] = np.where(stay_on, _RISK_ON_C, _NEUTRAL_C)
+    desired_all[_RISK_OFF_C] = np.where(stay_off, _RISK_OFF_C, _NEUTRAL_C)
+    desired_all[:, trigger_off] = _RISK_OFF_C
+
+    return _resolve_codes(desired_all, valid, _REGIME_TO_CODE[initial], config.confirm_bars)
+
 
-        desired = next_regime(
-            previous=prev,
-            trend=trend[i],
-            vol_pct=v,
+def classify_regimes(
+    *,
+    close: Sequence[float] | np.ndarray,
+    high: Sequence[float] | np.ndarray | None = None,
+    low: Sequence[float] | np.ndarray | None = None,
+    funding: Sequence[float] | np.ndarray | None = None,
+    config: RegimeConfig | None = None,
+    initial: Regime = Regime.NEUTRAL,
+    trend: list[int] | None = None,
+    vol_feats: VolatilityFeatures | None = None,
+) -> list[Regime]:
+    """Compute a regime label for each close; see :func:`classify_regime_codes`."""
+    return decode_regimes(
+        classify_regime_codes(
+            close=close,
+            high=high,
+            low=low,
+            funding=funding,
             config=config,
-            funding_sign=(funding_sign[i] if funding_sign is not None else None),
+            initial=initial,
+            trend=trend,
+            vol_feats=vol_feats,
         )
-
-        if desired == prev:
-            regimes.append(prev)
-            pending = None
-            pending_count = 0
-            continue
-
-        # Risk-off is conservative: allow immediate transition on trigger.
-        if desired == Regime.RISK_OFF:
-            prev = desired
-            regimes.append(prev)
-            pending = None
-            pending_count = 0
-            continue
-
-        if pending == desired:
-            pending_count += 1
-        else:
-            pending = desired
-            pending_count = 1
-
-        if pending_count >= config.confirm_bars:
-            prev = desired
-            pending = None
-            pending_count = 0
-
-        regimes.append(prev)
-
-    return regimes
+    )
@@ -13,6 +13,8 @@ import sys
 from pathlib import Path
 from typing import Any, Literal, cast
 
+import numpy as np
+
 from ssh_trader.data.clean import fill_missing_intervals, normalize_and_sort
 from ssh_trader.data.io_csv import load_ohlcv_csv
 from ssh_trader.data.model import parse_timeframe
@@ -22,6 +24,9 @@ from .compression import CompressionConfig, compression_score
 from .features import trend_signal, volatility_features_from_close
 from .regime import Regime, RegimeConfig, classify_regimes
 
+# Rows per writerows batch; keeps peak overhead low without per-row calls.
+_WRITE_BATCH_ROWS = 1024
+
 
 def _load_config(path: Path | None) -> dict[str, object]:
     if path is None:
@@ -160,15 +165,9 @@ def main(argv: list[str] | None = None) -> int:
         funding_mode=args.funding_mode,
     )
 
-    regimes = classify_regimes(
-        close=frame.close,
-        high=frame.high,
-        low=frame.low,
-        funding=frame.funding if args.funding_mode != "ignore" else None,
-        config=config,
-        initial=Regime(args.initial),
-    )
-
+    # With features requested, trend and vol features are computed once and
+    # handed to the classifier rather than recomputed inside it; the
+    # compression score is independent and stays separate.
     if args.include_features:
         trend = trend_signal(
             close=frame.close,
@@ -195,42 +194,69 @@ def main(argv: list[str] | None = None) -> int:
         score = []
         width = []
 
-    out_f = args.output.open("w", newline="") if args.output is not None else sys.stdout
+    regimes = classify_regimes(
+        close=frame.close,
+        high=frame.high,
+        low=frame.low,
+        funding=frame.funding if args.funding_mode != "ignore" else None,
+        config=config,
+        initial=Regime(args.initial),
+        trend=trend if args.include_features else None,
+        vol_feats=vol_feats,
+    )
+
+    # Rows are built up front and written with one writerows call per batch:
+    # per-row writerow dispatch (and its syscalls on line-buffered stdout)
+    # dominates large replays otherwise. Timestamp strings come from one
+    # bulk datetime64 format when the frame is whole-second (the usual
+    # case); sub-second frames keep the exact isoformat rendering.
+    ts_ns = frame.ts_ns
+    if ts_ns.size and (ts_ns % 1_000_000_000 == 0).all():
+        ts64 = (ts_ns // 1_000_000_000).astype("datetime64[s]")
+        ts_strs = np.char.add(np.datetime_as_string(ts64, unit="s"), "Z").tolist()
+    else:
+        ts_strs = [t.isoformat().replace("+00:00", "Z") for t in frame.ts]
+    if args.include_features:
+        header = [
+            "timestamp",
+            "close",
+            "trend",
+            "vol_pct",
+            "compression_score",
+            "compression_width",
+            "regime",
+        ]
+        vol_pct = vol_feats.vol_percentile if vol_feats is not None else []
+        # One zip over the precomputed columns instead of six indexed
+        # lookups per row.
+        rows: list[list[object]] = [
+            [
+                t,
+                c,
+                tr,
+                "" if vp is None else vp,
+                "" if sc is None else sc,
+                "" if wd is None else wd,
+                r.value,
+            ]
+            for t, c, tr, vp, sc, wd, r in zip(
+                ts_strs, frame.close, trend, vol_pct, score, width, regimes, strict=True
+            )
+        ]
+    else:
+        header = ["timestamp", "regime"]
+        rows = [[t, r.value] for t, r in zip(ts_strs, regimes, strict=True)]
+
+    out_f = (
+        args.output.open("w", newline="", buffering=1 << 20)
+        if args.output is not None
+        else sys.stdout
+    )
     try:
         writer = csv.writer(out_f)
-        if args.include_features:
-            writer.writerow(
-                [
-                    "timestamp",
-                    "close",
-                    "trend",
-                    "vol_pct",
-                    "compression_score",
-                    "compression_width",
-                    "regime",
-                ]
-            )
-        else:
-            writer.writerow(["timestamp", "regime"])
-
-        for i, r in enumerate(regimes):
-            t = frame.ts[i].isoformat().replace("+00:00", "Z")
-            if not args.include_features:
-                writer.writerow([t, r.value])
-                continue
-
-            vol_pct = vol_feats.vol_percentile[i] if vol_feats is not None else None
-            writer.writerow(
-                [
-                    t,
-                    frame.close[i],
-                    trend[i],
-                    "" if vol_pct is None else vol_pct,
-                    "" if score[i] is None else score[i],
-                    "" if width[i] is None else width[i],
-                    r.value,
-                ]
-            )
+        writer.writerow(header)
+        for start in range(0, len(rows), _WRITE_BATCH_ROWS):
+            writer.writerows(rows[start : start + _WRITE_BATCH_ROWS])
     finally:
         if args.output is not None:
             out_f.close()
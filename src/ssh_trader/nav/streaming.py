@@ -0,0 +1,154 @@
+"""Streaming (incremental) counterparts of the batch indicators.
+
+Each state object consumes one observation per ``push`` and updates in
+O(1), for live loops where recomputing a full window per bar would be
+O(n * w) over a session. Outputs match the batch functions in
+``indicators``: ``None`` during warm-up, then the same recurrences
+(running-sum SMA, standard EMA seeding, Wilder ATR seeded from the first
+full window, clamped mean-square realized volatility).
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+
+class SMAState:
+    """Rolling simple moving average; O(1) per push."""
+
+    __slots__ = ("_window", "_inv_w", "_sum", "_q")
+
+    def __init__(self, window: int) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self._window = window
+        self._inv_w = 1.0 / window
+        self._sum = 0.0
+        self._q: deque[float] = deque()
+
+    def push(self, value: float) -> float | None:
+        if not math.isfinite(value):
+            raise ValueError("values must be finite")
+        self._q.append(value)
+        self._sum += value
+        if len(self._q) > self._window:
+            self._sum -= self._q.popleft()
+        if len(self._q) == self._window:
+            return self._sum * self._inv_w
+        return None
+
+
+class EMAState:
+    """Exponential moving average with ``alpha = 2 / (span + 1)``.
+
+    The first push seeds the average, mirroring the batch ``ema``.
+    """
+
+    __slots__ = ("_alpha", "_prev")
+
+    def __init__(self, span: int) -> None:
+        if span <= 0:
+            raise ValueError("span must be positive")
+        self._alpha = 2.0 / (span + 1.0)
+        self._prev: float | None = None
+
+    def push(self, value: float) -> float:
+        if not math.isfinite(value):
+            raise ValueError("values must be finite")
+        prev = self._prev
+        if prev is None:
+            self._prev = value
+            return value
+        prev = prev + self._alpha * (value - prev)
+        self._prev = prev
+        return prev
+
+
+class ATRState:
+    """Wilder-smoothed Average True Range over streaming bars."""
+
+    __slots__ = ("_window", "_inv_w", "_w_less_1", "_prev_close", "_seed_sum", "_seen", "_prev")
+
+    def __init__(self, window: int = 14) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self._window = window
+        self._inv_w = 1.0 / window
+        self._w_less_1 = window - 1.0
+        self._prev_close: float | None = None
+        self._seed_sum = 0.0
+        self._seen = 0
+        self._prev: float | None = None
+
+    def push(self, high: float, low: float, close: float) -> float | None:
+        if not (math.isfinite(high) and math.isfinite(low) and math.isfinite(close)):
+            raise ValueError("high/low/close must be finite")
+        if high < low:
+            raise ValueError("high must be >= low")
+
+        prev_close = self._prev_close
+        if prev_close is None:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        self._prev_close = close
+
+        if self._prev is not None:
+            self._prev = (self._prev * self._w_less_1 + tr) * self._inv_w
+            return self._prev
+
+        self._seed_sum += tr
+        self._seen += 1
+        if self._seen == self._window:
+            self._prev = self._seed_sum * self._inv_w
+            return self._prev
+        return None
+
+
+class RVState:
+    """Rolling realized volatility over streaming returns.
+
+    Keeps running sums of ``r`` and ``r^2`` over the trailing window; the
+    variance is clamped at zero before the square root, like the batch
+    ``realized_volatility``.
+    """
+
+    __slots__ = ("_window", "_ann", "_demean", "_sum", "_sum_sq", "_q")
+
+    def __init__(
+        self,
+        window: int,
+        *,
+        annualization_factor: float = 1.0,
+        demean: bool = False,
+    ) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if annualization_factor <= 0.0 or not math.isfinite(annualization_factor):
+            raise ValueError("annualization_factor must be finite and positive")
+        self._window = window
+        self._ann = math.sqrt(annualization_factor)
+        self._demean = demean
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._q: deque[float] = deque()
+
+    def push(self, r: float) -> float | None:
+        if not math.isfinite(r):
+            raise ValueError("returns must be finite")
+        self._q.append(r)
+        self._sum += r
+        self._sum_sq += r * r
+        if len(self._q) > self._window:
+            old = self._q.popleft()
+            self._sum -= old
+            self._sum_sq -= old * old
+        if len(self._q) < self._window:
+            return None
+
+        var = self._sum_sq / self._window
+        if self._demean:
+            mean_r = self._sum / self._window
+            var -= mean_r * mean_r
+        return math.sqrt(max(0.0, var)) * self._ann
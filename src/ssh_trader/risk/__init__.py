@@ -1,6 +1,6 @@
 """risk domain for the ssh-trader GNC stack."""
 
-from .governor import RiskConfig, RiskDecision, RiskGovernor
+from .governor import RiskConfig, RiskDecision, RiskGovernor, make_risk_config
 from .module import RiskComponent
 
-__all__ = ["RiskComponent", "RiskConfig", "RiskDecision", "RiskGovernor"]
+__all__ = ["RiskComponent", "RiskConfig", "RiskDecision", "RiskGovernor", "make_risk_config"]
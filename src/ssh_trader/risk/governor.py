@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import math
 from dataclasses import dataclass
 from typing import Literal
@@ -26,6 +27,29 @@ class RiskConfig:
             raise ValueError("vol_spike_vol_pct must be finite and in (0, 1]")
 
 
+@functools.lru_cache(maxsize=1024)
+def make_risk_config(
+    leverage_cap: float = 1.5,
+    venue_cap_frac: float = 0.30,
+    max_drawdown: float = 0.20,
+    kill_switch_action: Literal["carry_only", "flat"] = "carry_only",
+    vol_spike_vol_pct: float = 0.90,
+) -> RiskConfig:
+    """Interning factory for :class:`RiskConfig`.
+
+    Parameter sweeps rebuild governors with a handful of distinct configs;
+    the cache skips the repeated ``__post_init__`` validation and returns
+    the same frozen instance for equal parameters.
+    """
+    return RiskConfig(
+        leverage_cap=leverage_cap,
+        venue_cap_frac=venue_cap_frac,
+        max_drawdown=max_drawdown,
+        kill_switch_action=kill_switch_action,
+        vol_spike_vol_pct=vol_spike_vol_pct,
+    )
+
+
 @dataclass(frozen=True, slots=True)
 class RiskDecision:
     kill_switch_active: bool
@@ -37,12 +61,60 @@ class RiskDecision:
 
 class RiskGovernor:
     def __init__(self, config: RiskConfig | None = None) -> None:
-        self._config = config if config is not None else RiskConfig()
+        cfg = config if config is not None else RiskConfig()
+        self._config = cfg
+        # Every field except directional_allowed is determined by the config
+        # and the kill flag, so the three possible decisions are prebuilt
+        # and shared across calls; decide_fast just picks one.
+        kill_mode: Literal["carry_only", "flat"] = (
+            "flat" if cfg.kill_switch_action == "flat" else "carry_only"
+        )
+        self._normal_directional = RiskDecision(
+            kill_switch_active=False,
+            mode="normal",
+            venue_cap_applied=cfg.venue_cap_frac,
+            leverage_cap_applied=cfg.leverage_cap,
+            directional_allowed=True,
+        )
+        self._normal_no_directional = RiskDecision(
+            kill_switch_active=False,
+            mode="normal",
+            venue_cap_applied=cfg.venue_cap_frac,
+            leverage_cap_applied=cfg.leverage_cap,
+            directional_allowed=False,
+        )
+        self._kill_decision = RiskDecision(
+            kill_switch_active=True,
+            mode=kill_mode,
+            venue_cap_applied=cfg.venue_cap_frac,
+            leverage_cap_applied=cfg.leverage_cap,
+            directional_allowed=False,
+        )
+        # dd >= max_drawdown - eps rearranged to avoid the per-call divide:
+        # nav <= peak_nav * (1 - (max_drawdown - eps)).
+        self._kill_ratio = 1.0 - (cfg.max_drawdown - 1e-12)
 
     @property
     def config(self) -> RiskConfig:
         return self._config
 
+    def decide_fast(
+        self,
+        *,
+        nav: float,
+        peak_nav: float,
+        vol_pct: float | None,
+        requested_directional: bool,
+    ) -> RiskDecision:
+        """Per-bar hot path: no input validation, returns a shared prebuilt
+        decision. Callers must guarantee finite positive nav/peak_nav; use
+        :meth:`decide` at external boundaries."""
+        if nav <= peak_nav * self._kill_ratio:
+            return self._kill_decision
+        if requested_directional and (vol_pct is None or vol_pct < self._config.vol_spike_vol_pct):
+            return self._normal_directional
+        return self._normal_no_directional
+
     def decide(
         self,
         *,
@@ -51,29 +123,13 @@ class RiskGovernor:
         vol_pct: float | None,
         requested_directional: bool,
     ) -> RiskDecision:
-        cfg = self._config
         if nav <= 0.0 or not math.isfinite(nav):
             raise ValueError("nav must be finite and positive")
         if peak_nav <= 0.0 or not math.isfinite(peak_nav):
             raise ValueError("peak_nav must be finite and positive")
-
-        dd = 1.0 - (nav / peak_nav)
-        kill = dd >= (cfg.max_drawdown - 1e-12)
-        if kill:
-            mode: Literal["normal", "carry_only", "flat"] = (
-                "flat" if cfg.kill_switch_action == "flat" else "carry_only"
-            )
-        else:
-            mode = "normal"
-
-        directional_allowed = requested_directional and mode == "normal"
-        if vol_pct is not None and vol_pct >= cfg.vol_spike_vol_pct:
-            directional_allowed = False
-
-        return RiskDecision(
-            kill_switch_active=kill,
-            mode=mode,
-            venue_cap_applied=cfg.venue_cap_frac,
-            leverage_cap_applied=cfg.leverage_cap,
-            directional_allowed=directional_allowed,
+        return self.decide_fast(
+            nav=nav,
+            peak_nav=peak_nav,
+            vol_pct=vol_pct,
+            requested_directional=requested_directional,
         )
@@ -4,10 +4,12 @@ from .levels import (
     Level,
     LevelClusterConfig,
     LevelProximity,
+    LevelProximityArray,
     LevelScoreConfig,
     PivotConfig,
     build_levels,
     compute_level_proximity,
+    compute_level_proximity_array,
     detect_pivots,
 )
 
@@ -15,9 +17,11 @@ __all__ = [
     "Level",
     "LevelClusterConfig",
     "LevelProximity",
+    "LevelProximityArray",
     "LevelScoreConfig",
     "PivotConfig",
     "build_levels",
     "compute_level_proximity",
+    "compute_level_proximity_array",
     "detect_pivots",
 ]
@@ -1,21 +1,24 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Sequence
 from dataclasses import dataclass
-from math import exp
+from math import isnan
 from typing import Literal
 
+import numpy as np
+
 from ssh_trader.nav.indicators import atr as atr_indicator
+from ssh_trader.utils._njit import njit
 
 LevelKind = Literal["support", "resistance"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PivotConfig:
     k: int = 3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LevelClusterConfig:
     band_atr_mult: float = 0.3
     min_separation_bars: int = 5
@@ -24,7 +27,7 @@ class LevelClusterConfig:
     reaction_atr_mult: float = 1.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LevelScoreConfig:
     touch_weight: float = 0.4
     recency_weight: float = 0.3
@@ -33,7 +36,7 @@ class LevelScoreConfig:
     top_n: int = 5
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Level:
     center: float
     band_low: float
@@ -45,7 +48,60 @@ class Level:
     kind: LevelKind
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class LevelArray:
+    """Columnar (structure-of-arrays) storage for a set of levels.
+
+    Scoring and selection run vectorized over these parallel arrays;
+    ``to_levels`` materializes :class:`Level` rows only at the API boundary.
+    ``touch_indices`` stays ragged as one int array per level.
+    """
+
+    center: np.ndarray
+    band_low: np.ndarray
+    band_high: np.ndarray
+    touch_count: np.ndarray
+    touch_indices: list[np.ndarray]
+    reaction_strength_atr: np.ndarray
+    score: np.ndarray
+    is_support: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.center.shape[0])
+
+    @classmethod
+    def from_levels(cls, levels: Sequence[Level]) -> LevelArray:
+        return cls(
+            center=np.asarray([lvl.center for lvl in levels], dtype=np.float64),
+            band_low=np.asarray([lvl.band_low for lvl in levels], dtype=np.float64),
+            band_high=np.asarray([lvl.band_high for lvl in levels], dtype=np.float64),
+            touch_count=np.asarray([lvl.touch_count for lvl in levels], dtype=np.int64),
+            touch_indices=[np.asarray(lvl.touch_indices, dtype=np.int64) for lvl in levels],
+            reaction_strength_atr=np.asarray(
+                [lvl.reaction_strength_atr for lvl in levels], dtype=np.float64
+            ),
+            score=np.asarray([lvl.score for lvl in levels], dtype=np.float64),
+            is_support=np.asarray([lvl.kind == "support" for lvl in levels], dtype=bool),
+        )
+
+    def to_levels(self, order: np.ndarray | None = None) -> list[Level]:
+        rows = range(len(self)) if order is None else order.tolist()
+        return [
+            Level(
+                center=float(self.center[i]),
+                band_low=float(self.band_low[i]),
+                band_high=float(self.band_high[i]),
+                touch_count=int(self.touch_count[i]),
+                touch_indices=self.touch_indices[i].tolist(),
+                reaction_strength_atr=float(self.reaction_strength_atr[i]),
+                score=float(self.score[i]),
+                kind="support" if self.is_support[i] else "resistance",
+            )
+            for i in rows
+        ]
+
+
+@dataclass(frozen=True, slots=True)
 class LevelProximity:
     level_index: int | None
     level_kind: LevelKind | None
@@ -53,21 +109,86 @@ class LevelProximity:
     distance_atr: float | None
 
 
-@dataclass
-class _Cluster:
-    kind: LevelKind
-    touches: list[int]
-    prices: list[float]
-    atrs: list[float]
-    last_idx: int
-    center: float
+@dataclass(frozen=True, slots=True)
+class LevelProximityArray:
+    """Columnar per-bar proximity results; the fast-path counterpart of a
+    ``list[LevelProximity]``.
+
+    ``level_index`` is -1 (with NaN distances) where no levels exist.
+    Rows are boxed into :class:`LevelProximity` only on demand via
+    ``__getitem__`` or ``to_list``.
+    """
+
+    level_index: np.ndarray
+    is_support: np.ndarray
+    distance_price: np.ndarray
+    distance_atr: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.level_index.shape[0])
+
+    def __getitem__(self, i: int) -> LevelProximity:
+        li = int(self.level_index[i])
+        if li < 0:
+            return LevelProximity(None, None, None, None)
+        da = float(self.distance_atr[i])
+        return LevelProximity(
+            level_index=li,
+            level_kind="support" if self.is_support[i] else "resistance",
+            distance_price=float(self.distance_price[i]),
+            distance_atr=None if isnan(da) else da,
+        )
+
+    def to_list(self) -> list[LevelProximity]:
+        return [self[i] for i in range(len(self))]
+
+
+@njit(cache=True)
+def _rolling_max_deque(a: np.ndarray, w: int) -> np.ndarray:
+    """O(n) windowed max via a monotonic index deque (ring buffer)."""
+    n = a.shape[0]
+    out = np.empty(n - w + 1, dtype=np.float64)
+    dq = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        while tail > head and a[dq[tail - 1]] <= a[i]:
+            tail -= 1
+        dq[tail] = i
+        tail += 1
+        if dq[head] <= i - w:
+            head += 1
+        if i >= w - 1:
+            out[i - w + 1] = a[dq[head]]
+    return out
+
+
+@njit(cache=True)
+def _rolling_min_deque(a: np.ndarray, w: int) -> np.ndarray:
+    """O(n) windowed min via a monotonic index deque (ring buffer)."""
+    n = a.shape[0]
+    out = np.empty(n - w + 1, dtype=np.float64)
+    dq = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        while tail > head and a[dq[tail - 1]] >= a[i]:
+            tail -= 1
+        dq[tail] = i
+        tail += 1
+        if dq[head] <= i - w:
+            head += 1
+        if i >= w - 1:
+            out[i - w + 1] = a[dq[head]]
+    return out
 
 
 def detect_pivots(
     high: Sequence[float],
     low: Sequence[float],
     config: PivotConfig | None = None,
-) -> tuple[list[bool], list[bool]]:
+) -> tuple[np.ndarray, np.ndarray]:
+    """Flag pivot highs/lows; returns two bool arrays aligned with the bars."""
     cfg = config or PivotConfig()
     k = cfg.k
     if k < 1:
@@ -75,25 +196,85 @@ def detect_pivots(
     n = len(high)
     if len(low) != n:
         raise ValueError("high/low length mismatch")
-    piv_high = [False] * n
-    piv_low = [False] * n
-    for i in range(k, n - k):
-        h = high[i]
-        lo = low[i]
-        if h >= max(high[i - k : i + k + 1]):
-            piv_high[i] = True
-        if lo <= min(low[i - k : i + k + 1]):
-            piv_low[i] = True
+    width = 2 * k + 1
+    if n < width:
+        return np.zeros(n, dtype=bool), np.zeros(n, dtype=bool)
+
+    # Centered rolling extrema from the O(n) monotonic-deque kernels (cost
+    # independent of k); a bar is a pivot when it matches its window's max
+    # (high) or min (low), exactly as the old per-bar slice scan decided.
+    h = np.asarray(high, dtype=np.float64)
+    lo = np.asarray(low, dtype=np.float64)
+    piv_high = np.zeros(n, dtype=bool)
+    piv_low = np.zeros(n, dtype=bool)
+    piv_high[k : n - k] = h[k : n - k] >= _rolling_max_deque(h, width)
+    piv_low[k : n - k] = lo[k : n - k] <= _rolling_min_deque(lo, width)
     return piv_high, piv_low
 
 
-def _iter_pivots(
-    prices: Sequence[float],
-    flags: Sequence[bool],
-) -> Iterable[tuple[int, float]]:
-    for i, is_pivot in enumerate(flags):
-        if is_pivot:
-            yield i, prices[i]
+@njit(cache=True)
+def _assign_clusters(
+    idxs: np.ndarray,
+    prices: np.ndarray,
+    atrs: np.ndarray,
+    band_mult: float,
+    min_sep: int,
+) -> tuple[np.ndarray, int]:
+    """Greedy first-fit clustering of one pivot kind.
+
+    Returns a cluster id per pivot plus the cluster count. Centers are
+    maintained as running sums, so appending is O(1) instead of the old
+    recompute-the-mean-per-touch.
+    """
+    m = idxs.shape[0]
+    assign = np.empty(m, dtype=np.int64)
+    centers = np.empty(m, dtype=np.float64)
+    sums = np.empty(m, dtype=np.float64)
+    counts = np.empty(m, dtype=np.int64)
+    last = np.empty(m, dtype=np.int64)
+    n_clusters = 0
+    for p in range(m):
+        band = band_mult * atrs[p]
+        chosen = -1
+        for c in range(n_clusters):
+            if abs(prices[p] - centers[c]) <= band and (idxs[p] - last[c]) >= min_sep:
+                chosen = c
+                break
+        if chosen >= 0:
+            sums[chosen] += prices[p]
+            counts[chosen] += 1
+            last[chosen] = idxs[p]
+            centers[chosen] = sums[chosen] / counts[chosen]
+        else:
+            chosen = n_clusters
+            centers[chosen] = prices[p]
+            sums[chosen] = prices[p]
+            counts[chosen] = 1
+            last[chosen] = idxs[p]
+            n_clusters += 1
+        assign[p] = chosen
+    return assign, n_clusters
+
+
+def _forward_extrema(close: np.ndarray, w: int) -> tuple[np.ndarray, np.ndarray]:
+    """Per-index max and min of ``close[i : i + w]`` (truncated at the end).
+
+    Shared across every cluster's reaction measurement, so each touch
+    reduces to one array lookup instead of re-scanning its lookahead
+    window.
+    """
+    n = close.shape[0]
+    cmax = np.empty(n, dtype=np.float64)
+    cmin = np.empty(n, dtype=np.float64)
+    start = max(0, n - w + 1)
+    if n >= w:
+        cmax[:start] = _rolling_max_deque(close, w)
+        cmin[:start] = _rolling_min_deque(close, w)
+    # Tail windows truncate at the last bar: suffix extrema via one
+    # reversed accumulate.
+    cmax[start:] = np.maximum.accumulate(close[start:][::-1])[::-1]
+    cmin[start:] = np.minimum.accumulate(close[start:][::-1])[::-1]
+    return cmax, cmin
 
 
 def build_levels(
@@ -116,133 +297,171 @@ def build_levels(
     cfg = cluster_config or LevelClusterConfig()
     score_cfg = score_config or LevelScoreConfig()
 
-    clusters: list[_Cluster] = []
+    # Clustering and reaction scans run as jitted kernels over flat arrays;
+    # only the final Level assembly stays in Python. Clusters never mix
+    # kinds, so each pivot kind is processed independently.
+    atr_arr = np.asarray([x if x is not None else np.nan for x in atr_series], dtype=np.float64)
+    close_arr = np.asarray(close, dtype=np.float64)
+    cmax, cmin = _forward_extrema(close_arr, cfg.reaction_lookahead + 1)
+
+    centers: list[float] = []
+    bands: list[float] = []
+    touch_counts: list[int] = []
+    touch_lists: list[np.ndarray] = []
+    reactions: list[float] = []
+    support_flags: list[bool] = []
+    sides: tuple[tuple[LevelKind, Sequence[float], np.ndarray], ...] = (
+        ("resistance", high, piv_high),
+        ("support", low, piv_low),
+    )
+    for kind, price_series, flags in sides:
+        pos = np.flatnonzero(flags)
+        with np.errstate(invalid="ignore"):
+            usable = atr_arr[pos] > 0.0
+        idxs = pos[usable]
+        if idxs.size == 0:
+            continue
+        prices = np.asarray(price_series, dtype=np.float64)[idxs]
+        atrs = atr_arr[idxs]
 
-    def add_pivot(idx: int, price: float, kind: LevelKind) -> None:
-        atr_i = atr_series[idx]
-        if atr_i is None or atr_i <= 0:
-            return
-        band = cfg.band_atr_mult * float(atr_i)
-        for c in clusters:
-            if c.kind != kind:
-                continue
-            center = c.center
-            last_idx = c.last_idx
-            if abs(price - center) <= band and (idx - last_idx) >= cfg.min_separation_bars:
-                c.touches.append(idx)
-                c.prices.append(price)
-                c.atrs.append(float(atr_i))
-                c.last_idx = idx
-                c.center = sum(c.prices) / len(c.prices)
-                return
-        clusters.append(
-            _Cluster(
-                kind=kind,
-                touches=[idx],
-                prices=[price],
-                atrs=[float(atr_i)],
-                last_idx=idx,
-                center=price,
-            )
+        assign, n_clusters = _assign_clusters(
+            idxs, prices, atrs, cfg.band_atr_mult, cfg.min_separation_bars
         )
-
-    for i, p in _iter_pivots(high, piv_high):
-        add_pivot(i, p, "resistance")
-    for i, p in _iter_pivots(low, piv_low):
-        add_pivot(i, p, "support")
-
-    levels: list[Level] = []
-    n = len(close)
-    for c in clusters:
-        touches = list(c.touches)
-        if len(touches) < cfg.min_touches:
-            continue
-        center = c.center
-        atrs = list(c.atrs)
-        band = cfg.band_atr_mult * (sum(atrs) / len(atrs))
-        reaction_vals: list[float] = []
-        for idx, atr_i in zip(touches, atrs, strict=True):
-            end = min(n - 1, idx + cfg.reaction_lookahead)
-            if c.kind == "support":
-                move = max(close[j] - center for j in range(idx, end + 1))
+        for c in range(n_clusters):
+            member = assign == c
+            touches = idxs[member]
+            if touches.shape[0] < cfg.min_touches:
+                continue
+            cluster_atrs = atrs[member]
+            center = float(prices[member].mean())
+            band = cfg.band_atr_mult * float(cluster_atrs.mean())
+            # Best post-touch move away from the level comes straight from
+            # the shared forward extrema; ATR > 0 is guaranteed by the
+            # usable mask above.
+            if kind == "support":
+                moves = cmax[touches] - center
             else:
-                move = max(center - close[j] for j in range(idx, end + 1))
-            reaction_vals.append(move / atr_i if atr_i > 0 else 0.0)
-        reaction = sum(reaction_vals) / len(reaction_vals) if reaction_vals else 0.0
-        if reaction < cfg.reaction_atr_mult:
-            continue
-        levels.append(
-            Level(
-                center=center,
-                band_low=center - band,
-                band_high=center + band,
-                touch_count=len(touches),
-                touch_indices=touches,
-                reaction_strength_atr=reaction,
-                score=0.0,
-                kind=c.kind,
-            )
-        )
-
-    levels = _score_levels(levels, score_cfg, len(close) - 1)
-    return _top_n(levels, score_cfg.top_n)
+                moves = center - cmin[touches]
+            reaction = float((moves / cluster_atrs).mean())
+            if reaction < cfg.reaction_atr_mult:
+                continue
+            centers.append(center)
+            bands.append(band)
+            touch_counts.append(int(touches.shape[0]))
+            touch_lists.append(touches)
+            reactions.append(reaction)
+            support_flags.append(kind == "support")
+
+    center_arr = np.asarray(centers, dtype=np.float64)
+    band_arr = np.asarray(bands, dtype=np.float64)
+    arr = LevelArray(
+        center=center_arr,
+        band_low=center_arr - band_arr,
+        band_high=center_arr + band_arr,
+        touch_count=np.asarray(touch_counts, dtype=np.int64),
+        touch_indices=touch_lists,
+        reaction_strength_atr=np.asarray(reactions, dtype=np.float64),
+        score=np.zeros(len(centers), dtype=np.float64),
+        is_support=np.asarray(support_flags, dtype=bool),
+    )
+    arr.score[:] = _score_array(arr, score_cfg, len(close) - 1)
+    return arr.to_levels(_top_n(arr, score_cfg.top_n))
+
+
+def _minmax_norm(x: np.ndarray) -> np.ndarray:
+    lo = float(x.min())
+    hi = float(x.max())
+    if hi == lo:
+        return np.ones_like(x)
+    return (x - lo) / (hi - lo)
+
+
+def _score_array(arr: LevelArray, cfg: LevelScoreConfig, last_idx: int) -> np.ndarray:
+    if len(arr) == 0:
+        return np.empty(0, dtype=np.float64)
+    half_life = max(1, cfg.recency_half_life)
+    # One flat exp over every touch age, segmented back per level with
+    # reduceat, instead of an exp/sum pair per level.
+    lengths = np.fromiter((t.shape[0] for t in arr.touch_indices), dtype=np.int64, count=len(arr))
+    recency = np.zeros(len(arr), dtype=np.float64)
+    nonempty = lengths > 0
+    if nonempty.any():
+        flat = np.concatenate([arr.touch_indices[i] for i in np.flatnonzero(nonempty)])
+        decay = np.exp(-(np.maximum(0, last_idx - flat) / half_life))
+        offsets = np.concatenate(([0], np.cumsum(lengths[nonempty])[:-1]))
+        recency[nonempty] = np.add.reduceat(decay, offsets)
+    score: np.ndarray = (
+        cfg.touch_weight * _minmax_norm(arr.touch_count.astype(np.float64))
+        + cfg.recency_weight * _minmax_norm(recency)
+        + cfg.reaction_weight * _minmax_norm(arr.reaction_strength_atr)
+    )
+    return score
 
 
 def _score_levels(levels: list[Level], cfg: LevelScoreConfig, last_idx: int) -> list[Level]:
     if not levels:
         return []
-    touch_vals = [lvl.touch_count for lvl in levels]
-    react_vals = [lvl.reaction_strength_atr for lvl in levels]
-    recency_vals: list[float] = []
-    for lvl in levels:
-        r = 0.0
-        for idx in lvl.touch_indices:
-            age = max(0, last_idx - idx)
-            r += exp(-age / max(1, cfg.recency_half_life))
-        recency_vals.append(r)
-    t_min, t_max = min(touch_vals), max(touch_vals)
-    r_min, r_max = min(react_vals), max(react_vals)
-    c_min, c_max = min(recency_vals), max(recency_vals)
-
-    def norm(val: float, lo: float, hi: float) -> float:
-        if hi == lo:
-            return 1.0
-        return (val - lo) / (hi - lo)
-
-    out: list[Level] = []
-    for lvl, tv, rv, cv in zip(levels, touch_vals, react_vals, recency_vals, strict=True):
-        score = (
-            cfg.touch_weight * norm(float(tv), float(t_min), float(t_max))
-            + cfg.recency_weight * norm(float(cv), float(c_min), float(c_max))
-            + cfg.reaction_weight * norm(float(rv), float(r_min), float(r_max))
-        )
-        out.append(
-            Level(
-                center=lvl.center,
-                band_low=lvl.band_low,
-                band_high=lvl.band_high,
-                touch_count=lvl.touch_count,
-                touch_indices=lvl.touch_indices,
-                reaction_strength_atr=lvl.reaction_strength_atr,
-                score=score,
-                kind=lvl.kind,
-            )
+    arr = LevelArray.from_levels(levels)
+    arr.score[:] = _score_array(arr, cfg, last_idx)
+    return arr.to_levels()
+
+
+def _top_n(arr: LevelArray, n: int) -> np.ndarray:
+    """Indices of the top-n supports followed by the top-n resistances.
+
+    Stable descending sort, so tied scores keep insertion order like the
+    old per-kind sorted() calls.
+    """
+    supports = _top_n_of_kind(np.flatnonzero(arr.is_support), arr.score, n)
+    resist = _top_n_of_kind(np.flatnonzero(~arr.is_support), arr.score, n)
+    return np.concatenate((supports, resist))
+
+
+def _top_n_of_kind(idx: np.ndarray, score: np.ndarray, n: int) -> np.ndarray:
+    if idx.size > n:
+        # O(L) selection of the n best, then an O(n log n) ordering pass;
+        # avoids the full sort when there are many candidate levels.
+        idx = idx[np.argpartition(-score[idx], n - 1)[:n]]
+    # lexsort: primary key score descending, ties by original index
+    # ascending — same order the stable per-kind sort produced.
+    return idx[np.lexsort((idx, -score[idx]))]
+
+
+def compute_level_proximity_array(
+    close: Sequence[float],
+    atr_series: Sequence[float | None],
+    levels: Sequence[Level],
+) -> LevelProximityArray:
+    n = len(close)
+    if not levels:
+        return LevelProximityArray(
+            level_index=np.full(n, -1, dtype=np.int64),
+            is_support=np.zeros(n, dtype=bool),
+            distance_price=np.full(n, np.nan),
+            distance_atr=np.full(n, np.nan),
         )
-    return out
 
+    # Broadcast close against the level centers: the whole nearest-level
+    # search is one (n, L) distance matrix, an argmin, and a gather.
+    close_arr = np.asarray(close, dtype=np.float64)
+    centers = np.fromiter((lvl.center for lvl in levels), dtype=np.float64, count=len(levels))
+    atr_arr = np.asarray([a if a is not None else np.nan for a in atr_series], dtype=np.float64)
+
+    d = np.abs(close_arr[:, None] - centers)
+    nearest = d.argmin(axis=1)
+    nearest_dist = np.take_along_axis(d, nearest[:, None], axis=1).ravel()
+    with np.errstate(invalid="ignore"):
+        dist_atr = np.where(atr_arr > 0.0, nearest_dist / atr_arr, np.nan)
 
-def _top_n(levels: list[Level], n: int) -> list[Level]:
-    supports = sorted(
-        (lvl for lvl in levels if lvl.kind == "support"),
-        key=lambda x: x.score,
-        reverse=True,
+    level_is_support = np.fromiter(
+        (lvl.kind == "support" for lvl in levels), dtype=bool, count=len(levels)
     )
-    resist = sorted(
-        (lvl for lvl in levels if lvl.kind == "resistance"),
-        key=lambda x: x.score,
-        reverse=True,
+    return LevelProximityArray(
+        level_index=nearest.astype(np.int64, copy=False),
+        is_support=level_is_support[nearest],
+        distance_price=nearest_dist,
+        distance_atr=dist_atr,
     )
-    return supports[:n] + resist[:n]
 
 
 def compute_level_proximity(
@@ -250,22 +469,5 @@ def compute_level_proximity(
     atr_series: Sequence[float | None],
     levels: Sequence[Level],
 ) -> list[LevelProximity]:
-    out: list[LevelProximity] = []
-    if not levels:
-        return [LevelProximity(None, None, None, None) for _ in close]
-    for i, px in enumerate(close):
-        nearest_idx: int | None = None
-        nearest_dist: float | None = None
-        for li, lvl in enumerate(levels):
-            dist = abs(px - lvl.center)
-            if nearest_dist is None or dist < nearest_dist:
-                nearest_dist = dist
-                nearest_idx = li
-        if nearest_idx is None or nearest_dist is None:
-            out.append(LevelProximity(None, None, None, None))
-            continue
-        atr_i = atr_series[i]
-        dist_atr = None if atr_i is None or atr_i <= 0 else nearest_dist / atr_i
-        lvl = levels[nearest_idx]
-        out.append(LevelProximity(nearest_idx, lvl.kind, nearest_dist, dist_atr))
-    return out
+    """Boxed form of :func:`compute_level_proximity_array`."""
+    return compute_level_proximity_array(close, atr_series, levels).to_list()
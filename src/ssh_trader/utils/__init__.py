@@ -0,0 +1,7 @@
+"""Shared utilities (optional acceleration helpers)."""
+
+from ._njit import njit
+
+__all__ = [
+    "njit",
+]
@@ -0,0 +1,40 @@
+"""Optional numba acceleration shim.
+
+``njit`` resolves to :func:`numba.njit` when numba is installed. Otherwise it
+degrades to a no-op decorator, so every kernel stays valid (and correct, just
+slower) as pure Python.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+__all__ = ["njit"]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+if TYPE_CHECKING:
+    # numba's own njit typing is loose enough that strict mypy treats jitted
+    # kernels as untyped; present it as a signature-preserving decorator
+    # factory instead, which matches the @njit(cache=True) form used here.
+    def njit(*args: Any, **kwargs: Any) -> Callable[[F], F]: ...
+
+else:
+
+    def _no_njit(*args, **kwargs):
+        """No-op stand-in for :func:`numba.njit` when numba is unavailable."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+    try:
+        import numba
+
+        njit = numba.njit
+    except ImportError:  # pragma: no cover - depends on the environment
+        njit = _no_njit
@@ -26,7 +26,7 @@ def test_load_csv_timezone_normalization_and_sort() -> None:
         assert frame.ts[0].utcoffset() == timezone.utc.utcoffset(datetime.now(tz=timezone.utc))
         # First row is 2020-01-01 05:00 UTC; second is 04:00 UTC,
         # so after sort the 04:00 comes first.
-        assert frame.close == [2.0, 1.0]
+        assert frame.close.tolist() == [2.0, 1.0]
 
 
 def test_fill_missing_intervals_inserts_synthetic_bars() -> None:
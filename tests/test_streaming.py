@@ -0,0 +1,46 @@
+import math
+
+from ssh_trader.nav.indicators import atr, ema, realized_volatility, sma
+from ssh_trader.nav.streaming import ATRState, EMAState, RVState, SMAState
+
+_ABS_TOL = 1e-10
+
+
+def _assert_series_close(actual: list[float | None], expected: list[float | None]) -> None:
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected, strict=True):
+        if e is None:
+            assert a is None
+        else:
+            assert a is not None
+            assert math.isclose(a, e, rel_tol=0.0, abs_tol=_ABS_TOL), (a, e)
+
+
+def test_sma_state_matches_batch() -> None:
+    values = [1.0, 2.0, 4.0, 8.0, 3.0, 5.0]
+    state = SMAState(window=3)
+    _assert_series_close([state.push(v) for v in values], sma(values, window=3))
+
+
+def test_ema_state_matches_batch() -> None:
+    values = [1.0, 2.0, 3.0, 2.5, 4.0]
+    state = EMAState(span=2)
+    _assert_series_close([state.push(v) for v in values], list(ema(values, span=2)))
+
+
+def test_atr_state_matches_batch() -> None:
+    high = [2.0, 3.0, 4.0, 3.5, 5.0, 4.5]
+    low = [1.0, 2.0, 2.5, 2.0, 3.5, 3.0]
+    close = [1.5, 2.5, 3.0, 3.0, 4.0, 4.0]
+    state = ATRState(window=3)
+    streamed = [state.push(h, lo, c) for h, lo, c in zip(high, low, close, strict=True)]
+    _assert_series_close(streamed, atr(high, low, close, window=3))
+
+
+def test_rv_state_matches_batch() -> None:
+    returns = [0.01, -0.02, 0.005, 0.03, -0.01, 0.0]
+    state = RVState(window=3, annualization_factor=252.0)
+    streamed = [state.push(r) for r in returns]
+    _assert_series_close(
+        streamed, realized_volatility(returns, window=3, annualization_factor=252.0)
+    )
@@ -14,8 +14,8 @@ def test_detect_pivots_simple() -> None:
     high = [1, 3, 2, 4, 1]
     low = [1, 1, 0, 1, 1]
     piv_h, piv_l = detect_pivots(high, low, PivotConfig(k=1))
-    assert piv_h == [False, True, False, True, False]
-    assert piv_l == [False, False, True, False, False]
+    assert piv_h.tolist() == [False, True, False, True, False]
+    assert piv_l.tolist() == [False, False, True, False, False]
 
 
 def test_build_levels_clustered_support_resistance() -> None: